@@ -19,6 +19,7 @@ from typing import Callable, List, Mapping, Optional, Tuple, Union
 
 import numpy as np
 from scipy import fft
+from scipy import optimize
 from scipy import signal
 from scipy import special
 
@@ -123,6 +124,51 @@ def inverse_monotone_function(func: Callable[[float], float],
     return upper_x
 
 
+def inverse_decreasing_function(func: Callable[[float], float],
+                                value: float,
+                                initial_guess: float,
+                                tolerance: float = 1e-12) -> float:
+  """Inverse a non-increasing function over the positive reals.
+
+  The solution is first bracketed by repeatedly doubling or halving the initial
+  guess, and then found with Brent's method, which typically needs far fewer
+  function evaluations than binary search.
+
+  Args:
+    func: The function to be inversed. Must be non-increasing.
+    value: The desired value of the function.
+    initial_guess: A positive initial guess for the solution.
+    tolerance: An acceptable error on the returned value.
+
+  Returns:
+    x such that func(x) is no more than value. It is guaranteed that the
+    returned x is approximately within tolerance of the smallest such x. When
+    func(x) is no more than value already for x <= tolerance, some such x is
+    returned.
+  """
+  lower_x = upper_x = initial_guess
+  while func(upper_x) > value:
+    lower_x = upper_x
+    upper_x *= 2
+  while lower_x > tolerance and func(lower_x) <= value:
+    upper_x = lower_x
+    lower_x /= 2
+
+  if lower_x == upper_x or lower_x <= tolerance:
+    return upper_x
+
+  x = optimize.brentq(lambda x: func(x) - value, lower_x, upper_x,
+                      xtol=tolerance)
+  # The root is only accurate to within the tolerance, so x is moved up until
+  # func(x) is no more than value. The step is doubled each time so that this
+  # also terminates when the tolerance is below the resolution of x.
+  step = tolerance
+  while func(x) > value:
+    x = min(x + step, upper_x)
+    step *= 2
+  return x
+
+
 def dictionary_to_list(
     input_dictionary: Mapping[int, float]) -> Tuple[int, List[float]]:
   """Converts an integer-keyed dictionary into an list.
@@ -125,6 +125,36 @@ class CommonTest(parameterized.TestCase):
     else:
       self.assertAlmostEqual(expected_x, x)
 
+  @parameterized.named_parameters(
+      {
+          'testcase_name': 'guess_below_solution',
+          'func': (lambda x: 1 / x),
+          'value': 0.2,
+          'initial_guess_x': 1,
+          'expected_x': 5,
+      }, {
+          'testcase_name': 'guess_above_solution',
+          'func': (lambda x: 1 / x),
+          'value': 0.2,
+          'initial_guess_x': 100,
+          'expected_x': 5,
+      }, {
+          'testcase_name': 'large_solution',
+          'func': (lambda x: -x),
+          'value': -1e6,
+          'initial_guess_x': 1,
+          'expected_x': 1e6,
+      })
+  def test_inverse_decreasing_function(self, func, value, initial_guess_x,
+                                       expected_x):
+    x = common.inverse_decreasing_function(func, value, initial_guess_x)
+    self.assertAlmostEqual(expected_x, x)
+    self.assertLessEqual(func(x), value)
+
+  def test_inverse_decreasing_function_always_below_value(self):
+    x = common.inverse_decreasing_function(lambda x: 1.0, 2.0, 1.0)
+    self.assertLessEqual(x, 1.0)
+
 
 class DictListConversionTest(parameterized.TestCase):
 
@@ -30,6 +30,11 @@ from dp_accounting.pld import common
 from dp_accounting.pld import pld_pmf
 from dp_accounting.pld import privacy_loss_mechanism
 
+# Number of discretization intervals first tried when discretizing a continuous
+# mechanism whose privacy loss at the upper truncation point is -infinity. The
+# number is doubled until the intervals reach that point.
+_INITIAL_NUM_INTERVALS_FOR_INFINITE_LOSS = 64
+
 
 def _deprecation_warning(method_name: str):
   logging.warning('PrivacyLossDistribution.%s() will be deprecated shortly. '
@@ -834,11 +839,13 @@ def _create_pld_pmf_from_additive_noise(
           raise ValueError('Connect dots bounds does not contain lower_x and '
                            'upper_x for discrete additive noise mechanism.')
         rounded_epsilons = []
-        for x in range(connect_dots_bounds.upper_x,
-                       connect_dots_bounds.lower_x - 1,
-                       -1):
-          scaled_epsilon = (additive_noise_privacy_loss.privacy_loss(x)
-                            / value_discretization_interval)
+        # Note that a vectorized call to privacy_loss is much faster than many
+        # scalar calls.
+        scaled_epsilons = additive_noise_privacy_loss.privacy_loss(
+            np.arange(connect_dots_bounds.upper_x,
+                      connect_dots_bounds.lower_x - 1,
+                      -1)) / value_discretization_interval
+        for scaled_epsilon in scaled_epsilons.tolist():
           if (not rounded_epsilons or
               math.floor(scaled_epsilon) > rounded_epsilons[-1]):
             rounded_epsilons.append(math.floor(scaled_epsilon))
@@ -879,45 +886,78 @@ def _create_pld_pmf_from_additive_noise(
   lower_x, upper_x = tail_pld.lower_x_truncation, tail_pld.upper_x_truncation
 
   rounded_probability_mass_function = collections.defaultdict(lambda: 0)
-  infinity_mass = tail_pld.tail_probability_mass_function.get(math.inf, 0)
-  for privacy_loss in tail_pld.tail_probability_mass_function:
-    if privacy_loss != math.inf:
+  infinity_mass = 0
+  for privacy_loss, probability_mass in zip(tail_pld.privacy_losses,
+                                            tail_pld.probability_masses):
+    if privacy_loss == math.inf:
+      infinity_mass += probability_mass
+    else:
       rounded_probability_mass_function[round_fn(
-          privacy_loss / value_discretization_interval
-      )] += tail_pld.tail_probability_mass_function[privacy_loss]
+          privacy_loss / value_discretization_interval)] += probability_mass
 
   if additive_noise_privacy_loss.discrete_noise:
-    xs = list(range(math.ceil(lower_x) - 1, math.floor(upper_x) + 1))
+    xs = np.arange(math.ceil(lower_x) - 1, math.floor(upper_x) + 1)
 
     # Compute PMF for the x's. Note that a vectorized call to mu_upper_cdf can
     # be much faster than many scalar calls.
     cdf_values = additive_noise_privacy_loss.mu_upper_cdf(xs)
     probability_mass = cdf_values[1:] - cdf_values[:-1]
+    scaled_privacy_losses = additive_noise_privacy_loss.privacy_loss(
+        xs[1:]) / value_discretization_interval
 
-    for x, prob in zip(xs[1:], probability_mass):
-      rounded_probability_mass_function[round_fn(
-          additive_noise_privacy_loss.privacy_loss(x) /
-          value_discretization_interval)] += prob
+    for scaled_privacy_loss, prob in zip(scaled_privacy_losses.tolist(),
+                                         probability_mass):
+      rounded_probability_mass_function[round_fn(scaled_privacy_loss)] += prob
   else:
     rounded_down_value = math.floor(
         additive_noise_privacy_loss.privacy_loss(lower_x) /
         value_discretization_interval)
     upper_x_privacy_loss = additive_noise_privacy_loss.privacy_loss(upper_x)
 
-    # Compute discretization intervals for PLD approximation.
-    xs, rounded_values = [lower_x], []
-    x = lower_x
-    while x < upper_x:
-      if (value_discretization_interval * rounded_down_value <=
-          upper_x_privacy_loss):
-        x = upper_x
+    # Compute discretization intervals for PLD approximation. The i-th interval
+    # ends at the inverse privacy loss of value_discretization_interval *
+    # (rounded_down_value - i), until this is at most upper_x_privacy_loss, in
+    # which case the interval ends at upper_x. Note that a vectorized call to
+    # inverse_privacy_loss is much faster than many scalar calls.
+    if math.isfinite(upper_x_privacy_loss):
+      # Only the candidates down to the first one that is at most
+      # upper_x_privacy_loss are needed, so a single pass suffices.
+      num_candidates = rounded_down_value + 2 - math.floor(
+          upper_x_privacy_loss / value_discretization_interval)
+    else:
+      # The privacy loss at upper_x is -infinity, so no candidate is at most
+      # upper_x_privacy_loss. The intervals then end at the first candidate
+      # whose inverse privacy loss reaches upper_x, which is only known after
+      # evaluating the inverse. The candidates are hence evaluated in passes of
+      # doubling size until one of them reaches upper_x.
+      num_candidates = _INITIAL_NUM_INTERVALS_FOR_INFINITE_LOSS
+    while True:
+      candidate_rounded_down_values = np.arange(
+          rounded_down_value, rounded_down_value - num_candidates, -1)
+      candidate_privacy_losses = (
+          value_discretization_interval * candidate_rounded_down_values)
+      is_at_most_upper_x_privacy_loss = (
+          candidate_privacy_losses <= upper_x_privacy_loss)
+      if np.any(is_at_most_upper_x_privacy_loss):
+        num_inner_xs = int(np.argmax(is_at_most_upper_x_privacy_loss))
       else:
-        x = additive_noise_privacy_loss.inverse_privacy_loss(
-            value_discretization_interval * rounded_down_value)
-
-      xs.append(x)
-      rounded_values.append(round_fn(rounded_down_value + 0.5))
-      rounded_down_value -= 1
+        num_inner_xs = num_candidates
+      inner_xs = additive_noise_privacy_loss.inverse_privacy_loss(
+          candidate_privacy_losses[:num_inner_xs])
+      if (num_inner_xs < num_candidates or lower_x >= upper_x or
+          np.any(inner_xs >= upper_x)):
+        break
+      num_candidates *= 2
+    xs = np.concatenate(([lower_x], inner_xs, [upper_x]))
+    # Stop at the first x that is at least upper_x.
+    num_intervals = int(np.argmax(xs[1:] >= upper_x)) + 1
+    if lower_x >= upper_x:
+      num_intervals = 0
+    xs = xs[:num_intervals + 1]
+    rounded_values = [
+        round_fn(value + 0.5) for value in
+        candidate_rounded_down_values[:num_intervals].tolist()
+    ]
 
     # Compute PLD for discretization intervals. Note that a vectorized call to
     # mu_upper_cdf is much faster than many scalar calls.
@@ -21,6 +21,7 @@ from scipy import stats
 from dp_accounting.pld import common
 from dp_accounting.pld import pld_pmf
 from dp_accounting.pld import privacy_loss_distribution
+from dp_accounting.pld import privacy_loss_mechanism
 from dp_accounting.pld import test_util
 
 
@@ -604,6 +605,39 @@ class LaplacePrivacyLossDistributionTest(parameterized.TestCase):
                           expected_rounded_pmf_add, 0.0,
                           expected_rounded_pmf_remove, 0.0)
 
+  @parameterized.parameters(
+      (1.0, privacy_loss_mechanism.AdjacencyType.REMOVE, {
+          2: 0.61059961,
+          1: 0.08613506,
+          0: 0.06708205,
+          -1: 0.23618328,
+          -2: 0.18393972
+      }),
+      (0.5, privacy_loss_mechanism.AdjacencyType.ADD, {
+          1: 0.69673467,
+          0: 0.10318682,
+          -1: 0.38401823
+      }))
+  def test_infinite_privacy_loss_at_upper_x_truncation(
+      self, sampling_prob, adjacency_type, expected_rounded_pmf):
+    """Verifies PLD when the privacy loss at upper_x_truncation is -infinity."""
+
+    class LaplaceWithInfinitePrivacyLossTail(
+        privacy_loss_mechanism.LaplacePrivacyLoss):
+
+      def privacy_loss(self, x):
+        if x >= self.privacy_loss_tail().upper_x_truncation:
+          return -math.inf
+        return super().privacy_loss(x)
+
+    pmf = privacy_loss_distribution._create_pld_pmf_from_additive_noise(
+        LaplaceWithInfinitePrivacyLossTail(
+            1.0, sampling_prob=sampling_prob, adjacency_type=adjacency_type),
+        value_discretization_interval=0.5)
+    test_util.assert_dictionary_almost_equal(self, expected_rounded_pmf,
+                                             pmf._loss_probs)
+    self.assertEqual(0, pmf._infinity_mass)
+
 
 class GaussianPrivacyLossDistributionTest(parameterized.TestCase):
 
@@ -21,13 +21,14 @@ Please refer to the supplementary material below for more details:
 """
 
 import abc
+import collections
 import dataclasses
 import enum
 import math
 import numbers
-from typing import Iterable, List, Mapping, Optional, Union
+from typing import Iterable, List, Mapping, Optional, Sequence, Tuple, Union
 import numpy as np
-from scipy import stats
+from scipy import special
 
 from dp_accounting.pld import common
 
@@ -54,6 +55,10 @@ class AdjacencyType(enum.Enum):
 class TailPrivacyLossDistribution:
   """Representation of the tail of privacy loss distribution.
 
+  The probability mass of the tail can be given either as
+  tail_probability_mass_function, or as the parallel arrays privacy_losses and
+  probability_masses. The other representation is derived from the given one.
+
   Attributes:
     lower_x_truncation: the minimum value of x that should be considered after
       the tail is discarded.
@@ -63,10 +68,46 @@ class TailPrivacyLossDistribution:
       distribution that has to be added due to the discarded tail; each key is a
       privacy loss value and the corresponding value is the probability mass
       that the value occurs.
+    privacy_losses: the privacy loss values at which probability mass of the
+      privacy loss distribution has to be added due to the discarded tail.
+    probability_masses: the probability masses that have to be added due to
+      the discarded tail; the i-th entry is the probability mass that the
+      privacy loss privacy_losses[i] occurs.
   """
   lower_x_truncation: float
   upper_x_truncation: float
-  tail_probability_mass_function: Mapping[float, float]
+  tail_probability_mass_function: Optional[Mapping[float, float]] = None
+  privacy_losses: Optional[np.ndarray] = dataclasses.field(
+      default=None, compare=False)
+  probability_masses: Optional[np.ndarray] = dataclasses.field(
+      default=None, compare=False)
+
+  def __post_init__(self):
+    has_arrays = (self.privacy_losses is not None and
+                  self.probability_masses is not None)
+    if (self.tail_probability_mass_function is None) == (not has_arrays):
+      raise ValueError(
+          'Exactly one of tail_probability_mass_function or both '
+          'privacy_losses and probability_masses must be specified')
+    # The dataclass is frozen, so the derived fields are set with
+    # object.__setattr__.
+    if has_arrays:
+      tail_probability_mass_function = collections.defaultdict(float)
+      for privacy_loss, probability_mass in zip(self.privacy_losses,
+                                                self.probability_masses):
+        tail_probability_mass_function[float(privacy_loss)] += float(
+            probability_mass)
+      object.__setattr__(self, 'tail_probability_mass_function',
+                         dict(tail_probability_mass_function))
+    else:
+      object.__setattr__(
+          self, 'privacy_losses',
+          np.array(list(self.tail_probability_mass_function.keys()),
+                   dtype=float))
+      object.__setattr__(
+          self, 'probability_masses',
+          np.array(list(self.tail_probability_mass_function.values()),
+                   dtype=float))
 
 
 @dataclasses.dataclass(frozen=True)
@@ -97,6 +138,41 @@ class ConnectDotsBounds:
   upper_x: Optional[int] = None
 
 
+def _is_close(a: np.ndarray, b: float) -> np.ndarray:
+  """Vectorized version of math.isclose(a, b) with default tolerances.
+
+  Args:
+    a: an array of values.
+    b: the value to compare to.
+
+  Returns:
+    A boolean array whose i-th entry is math.isclose(a[i], b), assuming b is
+    finite.
+  """
+  return np.isfinite(a) & (
+      np.abs(a - b) <= 1e-9 * np.maximum(np.abs(a), abs(b)))
+
+
+def _shift(x: Union[float, Iterable[float]],
+           shift: float) -> Union[float, np.ndarray]:
+  """Returns x + shift, where x is a point or points.
+
+  A single point is shifted with plain Python arithmetic, which avoids the
+  overhead of numpy for the scalar calls made at many points when computing
+  privacy loss distributions.
+
+  Args:
+    x: the point or points to be shifted.
+    shift: the amount by which to shift.
+
+  Returns:
+    x + shift, as a number if x is a number and as a numpy array otherwise.
+  """
+  if isinstance(x, numbers.Number):
+    return x + shift
+  return np.add(x, shift)
+
+
 class AdditiveNoisePrivacyLoss(metaclass=abc.ABCMeta):
   """Superclass for privacy loss of additive noise mechanisms.
 
@@ -167,6 +243,47 @@ class AdditiveNoisePrivacyLoss(metaclass=abc.ABCMeta):
     self.discrete_noise = discrete_noise
     self.sampling_prob = sampling_prob
     self.adjacency_type = adjacency_type
+    # Comparing enums is relatively slow, so the adjacency type is also stored
+    # as a bool for use on every call. Any adjacency type other than ADD is
+    # treated as REMOVE.
+    self._is_add = adjacency_type == AdjacencyType.ADD
+    # Constants depending only on sampling_prob, which are used in every
+    # computation involving sub-sampling.
+    self._log_sampling_prob = math.log(sampling_prob)
+    self._log_one_minus_sampling_prob = (
+        math.log1p(-sampling_prob) if sampling_prob < 1 else -math.inf)
+    self._inverse_sampling_prob = 1 / sampling_prob
+    self._one_minus_inverse_sampling_prob = 1 - 1 / sampling_prob
+    # The adjacency type and sampling probability are fixed, so the
+    # implementations specific to them are chosen once here rather than on
+    # every call. For performance, the case of sampling_prob=1 is handled
+    # separately.
+    if sampling_prob == 1.0:
+      self._privacy_loss_impl = self.privacy_loss_without_subsampling
+      self._inverse_privacy_loss_impl = (
+          self.inverse_privacy_loss_without_subsampling)
+      if self._is_add:
+        self._mu_upper_cdf_impl = self._mu_upper_cdf_add
+        self._mu_lower_log_cdf_impl = (
+            self._mu_lower_log_cdf_add_without_subsampling)
+      else:  # Case: adjacency_type == AdjacencyType.REMOVE
+        self._mu_upper_cdf_impl = self._mu_upper_cdf_remove_without_subsampling
+        self._mu_lower_log_cdf_impl = self._mu_lower_log_cdf_remove
+    elif self._is_add:
+      self._mu_upper_cdf_impl = self._mu_upper_cdf_add
+      self._mu_lower_log_cdf_impl = self._mu_lower_log_cdf_add
+      self._privacy_loss_impl = self._privacy_loss_add
+      self._inverse_privacy_loss_impl = self._inverse_privacy_loss_add
+    else:  # Case: adjacency_type == AdjacencyType.REMOVE
+      self._mu_upper_cdf_impl = self._mu_upper_cdf_remove
+      self._mu_lower_log_cdf_impl = self._mu_lower_log_cdf_remove
+      self._privacy_loss_impl = self._privacy_loss_remove
+      self._inverse_privacy_loss_impl = self._inverse_privacy_loss_remove
+    # The tail of the privacy loss distribution and the connect-the-dots bounds
+    # only depend on the fixed parameters of the mechanism, so subclasses store
+    # them here once computed.
+    self._privacy_loss_tail = None
+    self._connect_dots_bounds = None
 
   def mu_upper_cdf(
       self, x: Union[float, Iterable[float]]) -> Union[float, np.ndarray]:
@@ -185,15 +302,23 @@ class AdditiveNoisePrivacyLoss(metaclass=abc.ABCMeta):
       The cumulative density function of the mu_upper distribution at x, i.e.,
       the probability that mu_upper is less than or equal to x.
     """
+    return self._mu_upper_cdf_impl(x)
 
-    if self.adjacency_type == AdjacencyType.ADD:
-      return self.noise_cdf(x)
-    else:  # Case: self.adjacency_type == AdjacencyType.REMOVE
-      # For performance, the case of sampling_prob=1 is handled separately.
-      if self.sampling_prob == 1.0:
-        return self.noise_cdf(np.add(x, self.sensitivity))
-      return ((1 - self.sampling_prob) * self.noise_cdf(x) +
-              self.sampling_prob * self.noise_cdf(np.add(x, self.sensitivity)))
+  def _mu_upper_cdf_add(
+      self, x: Union[float, Iterable[float]]) -> Union[float, np.ndarray]:
+    """Computes mu_upper_cdf for ADD adjacency type."""
+    return self.noise_cdf(x)
+
+  def _mu_upper_cdf_remove(
+      self, x: Union[float, Iterable[float]]) -> Union[float, np.ndarray]:
+    """Computes mu_upper_cdf for REMOVE adjacency type."""
+    return ((1 - self.sampling_prob) * self.noise_cdf(x) +
+            self.sampling_prob * self.noise_cdf(_shift(x, self.sensitivity)))
+
+  def _mu_upper_cdf_remove_without_subsampling(
+      self, x: Union[float, Iterable[float]]) -> Union[float, np.ndarray]:
+    """Computes mu_upper_cdf for REMOVE adjacency type when sampling_prob=1."""
+    return self.noise_cdf(_shift(x, self.sensitivity))
 
   def mu_lower_log_cdf(
       self, x: Union[float, Iterable[float]]) -> Union[float, np.ndarray]:
@@ -213,18 +338,51 @@ class AdditiveNoisePrivacyLoss(metaclass=abc.ABCMeta):
       x, i.e., the log of the probability that mu_lower is less than or equal to
       x.
     """
-    if self.adjacency_type == AdjacencyType.ADD:
-      # For performance, the case of sampling_prob=1 is handled separately.
-      if self.sampling_prob == 1.0:
-        return self.noise_log_cdf(np.add(x, -self.sensitivity))
-      return np.logaddexp(
-          np.log1p(-self.sampling_prob) + self.noise_log_cdf(x),
-          np.log(self.sampling_prob) +
-          self.noise_log_cdf(np.add(x, -self.sensitivity))
-      )
+    return self._mu_lower_log_cdf_impl(x)
+
+  def _mu_lower_log_cdf_add(
+      self, x: Union[float, Iterable[float]]) -> Union[float, np.ndarray]:
+    """Computes mu_lower_log_cdf for ADD adjacency type."""
+    return np.logaddexp(
+        self._log_one_minus_sampling_prob + self.noise_log_cdf(x),
+        self._log_sampling_prob +
+        self.noise_log_cdf(_shift(x, -self.sensitivity))
+    )
+
+  def _mu_lower_log_cdf_add_without_subsampling(
+      self, x: Union[float, Iterable[float]]) -> Union[float, np.ndarray]:
+    """Computes mu_lower_log_cdf for ADD adjacency type when sampling_prob=1."""
+    return self.noise_log_cdf(_shift(x, -self.sensitivity))
+
+  def _mu_lower_log_cdf_remove(
+      self, x: Union[float, Iterable[float]]) -> Union[float, np.ndarray]:
+    """Computes mu_lower_log_cdf for REMOVE adjacency type."""
+    return self.noise_log_cdf(x)
 
+  def _mu_upper_cdf_and_lower_log_cdf(
+      self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Computes both mu_upper_cdf(x) and mu_lower_log_cdf(x).
+
+    With sub-sampling, both quantities depend on the noise distribution at x,
+    which is hence evaluated only once.
+
+    Args:
+      x: the points at which the functions are to be calculated.
+
+    Returns:
+      A pair of mu_upper_cdf(x) and mu_lower_log_cdf(x).
+    """
+    if self.sampling_prob == 1.0:
+      return self.mu_upper_cdf(x), self.mu_lower_log_cdf(x)
+    noise_cdf, noise_log_cdf = self._noise_cdf_and_log_cdf(x)
+    if self._is_add:
+      return noise_cdf, np.logaddexp(
+          self._log_one_minus_sampling_prob + noise_log_cdf,
+          self._log_sampling_prob +
+          self.noise_log_cdf(np.add(x, -self.sensitivity)))
     else:  # Case: self.adjacency_type == AdjacencyType.REMOVE
-      return self.noise_log_cdf(x)
+      return ((1 - self.sampling_prob) * noise_cdf + self.sampling_prob *
+              self.noise_cdf(np.add(x, self.sensitivity))), noise_log_cdf
 
   def get_delta_for_epsilon(
       self, epsilon: Union[float, List[float]]) -> Union[float, List[float]]:
@@ -256,31 +414,55 @@ class AdditiveNoisePrivacyLoss(metaclass=abc.ABCMeta):
       A non-negative real number which is the epsilon-hockey stick divergence of
       the mechanism, or a numpy array if epsilon is list-like.
     """
-    is_scalar = isinstance(epsilon, numbers.Number)
-    epsilons = np.array([epsilon]) if is_scalar else np.asarray(epsilon)
-    deltas = np.zeros_like(epsilons, dtype=float)
+    if isinstance(epsilon, numbers.Number):
+      # For performance, a single epsilon is handled with Python scalars.
+      if self.sampling_prob != 1.0:
+        if self._is_add:
+          if epsilon >= -self._log_one_minus_sampling_prob:
+            return 0.0
+        elif epsilon <= self._log_one_minus_sampling_prob:
+          # Case: self.adjacency_type == AdjacencyType.REMOVE
+          return min(max(-math.expm1(epsilon), 0.0), 1.0)
+      x_cutoff = self.inverse_privacy_loss(epsilon)
+      mu_upper_cdf, mu_lower_log_cdf = self._mu_upper_cdf_and_lower_log_cdf(
+          x_cutoff)
+      delta = float(mu_upper_cdf) - math.exp(epsilon + float(mu_lower_log_cdf))
+      # Clip delta value to lie in [0,1] (to avoid numerical errors)
+      return min(max(delta, 0.0), 1.0)
+
+    epsilons = np.asarray(epsilon, dtype=float)
     if self.sampling_prob == 1.0:
       inverse_indices = np.full_like(epsilons, True, dtype=bool)
-    elif self.adjacency_type == AdjacencyType.ADD:
-      inverse_indices = epsilons < -math.log1p(-self.sampling_prob)
+      deltas = np.zeros_like(epsilons)
+    elif self._is_add:
+      inverse_indices = epsilons < -self._log_one_minus_sampling_prob
+      deltas = np.zeros_like(epsilons)
     else:  # Case: self.adjacency_type == AdjacencyType.REMOVE
-      inverse_indices = epsilons > math.log1p(-self.sampling_prob)
-      other_indices = np.logical_not(inverse_indices)
-      deltas[other_indices] = -np.expm1(epsilons[other_indices])
-    x_cutoffs = np.array([
-        self.inverse_privacy_loss(eps) for eps in epsilons[inverse_indices]
-    ])
-    deltas[inverse_indices] = (
-        self.mu_upper_cdf(x_cutoffs) -
-        np.exp(epsilons[inverse_indices] + self.mu_lower_log_cdf(x_cutoffs)))
+      inverse_indices = epsilons > self._log_one_minus_sampling_prob
+      # The deltas at the remaining epsilons are 1 - exp(epsilon).
+      deltas = np.where(inverse_indices, 0.0, -np.expm1(epsilons))
+    inverse_epsilons = epsilons[inverse_indices]
+    x_cutoffs = self._inverse_privacy_loss_array(inverse_epsilons)
+    mu_upper_cdfs, mu_lower_log_cdfs = self._mu_upper_cdf_and_lower_log_cdf(
+        x_cutoffs)
+    # The deltas mu_upper_cdfs - exp(epsilon + mu_lower_log_cdfs) are computed
+    # in the buffer holding the copy of the epsilons, to avoid temporaries.
+    inverse_deltas = inverse_epsilons
+    np.add(inverse_deltas, mu_lower_log_cdfs, out=inverse_deltas)
+    np.exp(inverse_deltas, out=inverse_deltas)
+    np.subtract(mu_upper_cdfs, inverse_deltas, out=inverse_deltas)
+    deltas[inverse_indices] = inverse_deltas
     # Clip delta values to lie in [0,1] (to avoid numerical errors)
-    deltas = np.clip(deltas, 0, 1)
-    return float(deltas) if is_scalar else deltas
+    return np.clip(deltas, 0, 1, out=deltas)
 
   @abc.abstractmethod
   def privacy_loss_tail(self) -> TailPrivacyLossDistribution:
     """Computes the privacy loss at the tail of the distribution.
 
+    The tail only depends on the fixed parameters of the mechanism, so
+    implementations may store the result in _privacy_loss_tail and return it
+    on subsequent calls.
+
     Returns:
       A TailPrivacyLossDistribution instance representing the tail of the
       privacy loss distribution.
@@ -294,6 +476,10 @@ class AdditiveNoisePrivacyLoss(metaclass=abc.ABCMeta):
   def connect_dots_bounds(self) -> ConnectDotsBounds:
     """Computes the bounds on epsilon values to use in connect-the-dots algorithm.
 
+    The bounds only depend on the fixed parameters of the mechanism, so
+    implementations may store the result in _connect_dots_bounds and return it
+    on subsequent calls.
+
     Returns:
       A ConnectDotsBounds instance containing either
       - upper and lower values of epsilon for continuous noise mechanisms, or
@@ -301,8 +487,9 @@ class AdditiveNoisePrivacyLoss(metaclass=abc.ABCMeta):
       These values are to be used in connect-the-dots algorithm.
     """
 
-  def privacy_loss(self, x: float) -> float:
-    """Computes the privacy loss at a given point.
+  def privacy_loss(
+      self, x: Union[float, Iterable[float]]) -> Union[float, np.ndarray]:
+    """Computes the privacy loss at a given point or points.
 
     For ADD adjacency type, with sub-sampling probability of q:
     the privacy loss at x is
@@ -313,34 +500,111 @@ class AdditiveNoisePrivacyLoss(metaclass=abc.ABCMeta):
     log(1-q + q*exp(privacy_loss_without_subsampling(x))).
 
     Args:
-      x: the point at which the privacy loss is computed.
+      x: the point, or list-like object of points, at which the privacy loss is
+        computed.
 
     Returns:
-      The privacy loss at point x.
+      The privacy loss at point x, or a numpy array of the privacy losses at
+      each of the points if x is list-like.
 
     Raises:
       NotImplementedError: If privacy_loss_without_subsampling is not
         implemented by the subclass.
       ValueError: If privacy loss is undefined at x.
     """
+    if isinstance(x, numbers.Number):
+      return self._privacy_loss_impl(x)
+    return self._privacy_loss_array(np.asarray(x))
+
+  def _privacy_loss_add(self, x: float) -> float:
+    """Computes privacy_loss for ADD adjacency type."""
+    privacy_loss_without_subsampling = self.privacy_loss_without_subsampling(x)
+    # Privacy loss is
+    # -log(1 - sampling_prob +
+    #      sampling_prob * exp(-privacy_loss_without_subsampling)).
+    return -self._log_mixture(-privacy_loss_without_subsampling)
+
+  def _privacy_loss_remove(self, x: float) -> float:
+    """Computes privacy_loss for REMOVE adjacency type."""
     privacy_loss_without_subsampling = self.privacy_loss_without_subsampling(x)
+    # Privacy loss is
+    # log(1 - sampling_prob +
+    #     sampling_prob * exp(privacy_loss_without_subsampling)).
+    return self._log_mixture(privacy_loss_without_subsampling)
+
+  def _log_mixture(self, exponent: float) -> float:
+    """Computes log(1 - sampling_prob + sampling_prob * exp(exponent)).
+
+    This is evaluated as common.log_a_times_exp_b_plus_c does, but from the
+    logs of sampling_prob and 1 - sampling_prob computed at construction.
+    _privacy_loss_array uses the same operations on arrays. Requires
+    sampling_prob < 1.
+
+    Args:
+      exponent: the exponent in the formula above.
+
+    Returns:
+      The value of log(1 - sampling_prob + sampling_prob * exp(exponent)).
+    """
+    if exponent == 0:
+      return 0.0
+    log_term = exponent + self._log_sampling_prob
+    log_constant = self._log_one_minus_sampling_prob
+    max_term = max(log_term, log_constant)
+    return max_term + math.log1p(
+        math.exp(min(log_term, log_constant) - max_term))
+
+  def _privacy_loss_array(self, xs: np.ndarray) -> np.ndarray:
+    """Computes privacy_loss for each of the given points.
+
+    This is a vectorized version of privacy_loss, which evaluates
+    log(1-q + q*exp(+-privacy_loss_without_subsampling(x))) in the same way as
+    _log_mixture, so that the results match exactly.
+
+    Args:
+      xs: an array of points.
+
+    Returns:
+      An array whose i-th entry is privacy_loss(xs[i]).
+    """
+    privacy_losses_without_subsampling = (
+        self._privacy_loss_without_subsampling_array(xs))
     # For performance, the case of sampling_prob=1 is handled separately.
     if self.sampling_prob == 1.0:
-      return privacy_loss_without_subsampling
-    if self.adjacency_type == AdjacencyType.ADD:
-      # Privacy loss is
-      # -log(1 - sampling_prob +
-      #      sampling_prob * exp(-privacy_loss_without_subsampling)).
-      return -common.log_a_times_exp_b_plus_c(self.sampling_prob,
-                                              -privacy_loss_without_subsampling,
-                                              1 - self.sampling_prob)
+      return privacy_losses_without_subsampling
+
+    if self._is_add:
+      exponents = -privacy_losses_without_subsampling
+    else:  # Case: self.adjacency_type == AdjacencyType.REMOVE
+      exponents = privacy_losses_without_subsampling
+    log_terms = exponents + self._log_sampling_prob
+    log_constant = self._log_one_minus_sampling_prob
+    max_terms = np.maximum(log_terms, log_constant)
+    privacy_losses = max_terms + np.log1p(
+        np.exp(np.minimum(log_terms, log_constant) - max_terms))
+    privacy_losses[exponents == 0] = 0.0
+    if self._is_add:
+      return -privacy_losses
     else:  # Case: self.adjacency_type == AdjacencyType.REMOVE
-      # Privacy loss is
-      # log(1 - sampling_prob +
-      #      sampling_prob * exp(privacy_loss_without_subsampling)).
-      return common.log_a_times_exp_b_plus_c(self.sampling_prob,
-                                             privacy_loss_without_subsampling,
-                                             1 - self.sampling_prob)
+      return privacy_losses
+
+  def _privacy_loss_without_subsampling_array(self,
+                                              xs: np.ndarray) -> np.ndarray:
+    """Computes privacy_loss_without_subsampling for an array.
+
+    Subclasses may override this with a vectorized implementation.
+
+    Args:
+      xs: an array of points.
+
+    Returns:
+      An array whose i-th entry is privacy_loss_without_subsampling(xs[i]).
+    """
+    # The points are converted to Python numbers, as expected by the scalar
+    # implementations of discrete mechanisms.
+    return np.array([
+        self.privacy_loss_without_subsampling(x) for x in xs.tolist()
+    ], dtype=float)
 
   @abc.abstractmethod
   def privacy_loss_without_subsampling(self, x: float) -> float:
@@ -365,15 +629,19 @@ class AdditiveNoisePrivacyLoss(metaclass=abc.ABCMeta):
     """
     raise NotImplementedError
 
-  def inverse_privacy_loss(self, privacy_loss: float) -> float:
+  def inverse_privacy_loss(
+      self,
+      privacy_loss: Union[float, Iterable[float]]) -> Union[float, np.ndarray]:
     """Computes the inverse of a given privacy loss.
 
     Args:
-      privacy_loss: the privacy loss value.
+      privacy_loss: the privacy loss value, or list-like object of privacy loss
+        values.
 
     Returns:
       The largest float x such that the privacy loss at x is at least
-      privacy_loss.
+      privacy_loss, or a numpy array of such values if privacy_loss is
+      list-like.
 
       For the ADD adjacency type, with sub-sampling probability of q:
       the inverse privacy loss is given as
@@ -399,37 +667,123 @@ class AdditiveNoisePrivacyLoss(metaclass=abc.ABCMeta):
       ValueError: If inverse_privacy_loss_without_subsampling raises a
         ValueError
     """
+    if isinstance(privacy_loss, numbers.Number):
+      return self._inverse_privacy_loss_impl(privacy_loss)
+
+    privacy_losses = np.asarray(privacy_loss, dtype=float)
+    if self.sampling_prob != 1.0:
+      if self._is_add:
+        boundary = -self._log_one_minus_sampling_prob
+        is_invalid = ((privacy_losses > boundary) &
+                      ~_is_close(privacy_losses, boundary))
+        if np.any(is_invalid):
+          raise ValueError(f'privacy_loss ({privacy_losses[is_invalid][0]}) '
+                           f'is larger than -log(1 - sampling_prob) '
+                           f'({boundary}')
+      else:  # Case: self.adjacency_type == AdjacencyType.REMOVE
+        boundary = self._log_one_minus_sampling_prob
+        is_invalid = ((privacy_losses <= boundary) &
+                      ~_is_close(privacy_losses, boundary))
+        if np.any(is_invalid):
+          raise ValueError(f'privacy_loss ({privacy_losses[is_invalid][0]}) '
+                           f'is smaller than log(1 - sampling_prob) '
+                           f'({boundary}')
+    return self._inverse_privacy_loss_array(privacy_losses)
+
+  def _inverse_privacy_loss_add(self, privacy_loss: float) -> float:
+    """Computes inverse_privacy_loss for ADD adjacency type."""
+    if math.isclose(privacy_loss, -self._log_one_minus_sampling_prob):
+      return self.inverse_privacy_loss_without_subsampling(math.inf)
+    if privacy_loss > -self._log_one_minus_sampling_prob:
+      raise ValueError(f'privacy_loss ({privacy_loss}) is larger than '
+                       f'-log(1 - sampling_prob) '
+                       f'({-self._log_one_minus_sampling_prob}')
+    # Privacy loss without subsampling is
+    # -log(1 + (exp(-privacy_loss) - 1) / sampling_prob).
+    privacy_loss_without_subsampling = -common.log_a_times_exp_b_plus_c(
+        self._inverse_sampling_prob, -privacy_loss,
+        self._one_minus_inverse_sampling_prob)
+    return self.inverse_privacy_loss_without_subsampling(
+        privacy_loss_without_subsampling)
+
+  def _inverse_privacy_loss_remove(self, privacy_loss: float) -> float:
+    """Computes inverse_privacy_loss for REMOVE adjacency type."""
+    if math.isclose(privacy_loss, self._log_one_minus_sampling_prob):
+      return self.inverse_privacy_loss_without_subsampling(-math.inf)
+    if privacy_loss <= self._log_one_minus_sampling_prob:
+      raise ValueError(f'privacy_loss ({privacy_loss}) is smaller than '
+                       f'log(1 - sampling_prob) '
+                       f'({self._log_one_minus_sampling_prob}')
+    # Privacy loss without subsampling is
+    # log(1 + (exp(privacy_loss) - 1) / sampling_prob).
+    privacy_loss_without_subsampling = common.log_a_times_exp_b_plus_c(
+        self._inverse_sampling_prob, privacy_loss,
+        self._one_minus_inverse_sampling_prob)
+    return self.inverse_privacy_loss_without_subsampling(
+        privacy_loss_without_subsampling)
+
+  def _inverse_privacy_loss_array(self,
+                                  privacy_losses: np.ndarray) -> np.ndarray:
+    """Computes inverse_privacy_loss for each of the given privacy losses.
+
+    This is a vectorized version of inverse_privacy_loss. Unlike
+    inverse_privacy_loss, it does not validate its input: every privacy loss is
+    assumed to be at most -log(1-q) for ADD adjacency type and more than
+    log(1-q) for REMOVE adjacency type, where q is the sub-sampling probability.
+
+    Args:
+      privacy_losses: an array of privacy loss values.
+
+    Returns:
+      An array whose i-th entry is inverse_privacy_loss(privacy_losses[i]).
+    """
+    privacy_losses = np.asarray(privacy_losses, dtype=float)
     # For performance, the case of sampling_prob=1 is handled separately.
     if self.sampling_prob == 1.0:
-      return self.inverse_privacy_loss_without_subsampling(privacy_loss)
-
-    if self.adjacency_type == AdjacencyType.ADD:
-      if math.isclose(privacy_loss, - math.log(1 - self.sampling_prob)):
-        return self.inverse_privacy_loss_without_subsampling(math.inf)
-      if privacy_loss > - math.log(1 - self.sampling_prob):
-        raise ValueError(f'privacy_loss ({privacy_loss}) is larger than '
-                         f'-log(1 - sampling_prob) '
-                         f'({-math.log(1 - self.sampling_prob)}')
-      # Privacy loss without subsampling is
-      # -log(1 + (exp(-privacy_loss) - 1) / sampling_prob).
-      privacy_loss_without_subsampling = -common.log_a_times_exp_b_plus_c(
-          1 / self.sampling_prob, -privacy_loss, 1 - 1 / self.sampling_prob)
-      return self.inverse_privacy_loss_without_subsampling(
-          privacy_loss_without_subsampling)
+      return self._inverse_privacy_loss_without_subsampling_array(
+          privacy_losses)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+      if self._is_add:
+        # Privacy loss without subsampling is
+        # -log(1 + (exp(-privacy_loss) - 1) / sampling_prob), which is equal to
+        # privacy_loss + log(sampling_prob)
+        #   - log(1 - (1 - sampling_prob) * exp(privacy_loss)).
+        boundary, boundary_value = -self._log_one_minus_sampling_prob, math.inf
+        privacy_losses_without_subsampling = (
+            privacy_losses + self._log_sampling_prob -
+            np.log1p(-(1 - self.sampling_prob) * np.exp(privacy_losses)))
+      else:  # Case: self.adjacency_type == AdjacencyType.REMOVE
+        # Privacy loss without subsampling is
+        # log(1 + (exp(privacy_loss) - 1) / sampling_prob), which is equal to
+        # privacy_loss - log(sampling_prob)
+        #   + log(1 - (1 - sampling_prob) * exp(-privacy_loss)).
+        boundary, boundary_value = self._log_one_minus_sampling_prob, -math.inf
+        privacy_losses_without_subsampling = (
+            privacy_losses - self._log_sampling_prob +
+            np.log1p(-(1 - self.sampling_prob) * np.exp(-privacy_losses)))
+    privacy_losses_without_subsampling[
+        _is_close(privacy_losses, boundary)] = boundary_value
+    return self._inverse_privacy_loss_without_subsampling_array(
+        privacy_losses_without_subsampling)
+
+  def _inverse_privacy_loss_without_subsampling_array(
+      self, privacy_losses: np.ndarray) -> np.ndarray:
+    """Computes inverse_privacy_loss_without_subsampling for an array.
+
+    Subclasses may override this with a vectorized implementation.
 
-    else:  # Case: self.adjacency_type == AdjacencyType.REMOVE
-      if math.isclose(privacy_loss, math.log(1 - self.sampling_prob)):
-        return self.inverse_privacy_loss_without_subsampling(-math.inf)
-      if privacy_loss <= math.log(1 - self.sampling_prob):
-        raise ValueError(f'privacy_loss ({privacy_loss}) is smaller than '
-                         f'log(1 - sampling_prob) '
-                         f'({math.log(1 - self.sampling_prob)}')
-      # Privacy loss without subsampling is
-      # log(1 + (exp(privacy_loss) - 1) / sampling_prob).
-      privacy_loss_without_subsampling = common.log_a_times_exp_b_plus_c(
-          1 / self.sampling_prob, privacy_loss, 1 - 1 / self.sampling_prob)
-      return self.inverse_privacy_loss_without_subsampling(
-          privacy_loss_without_subsampling)
+    Args:
+      privacy_losses: an array of privacy loss values.
+
+    Returns:
+      An array whose i-th entry is
+      inverse_privacy_loss_without_subsampling(privacy_losses[i]).
+    """
+    return np.array([
+        self.inverse_privacy_loss_without_subsampling(privacy_loss)
+        for privacy_loss in privacy_losses
+    ], dtype=float)
 
   @abc.abstractmethod
   def inverse_privacy_loss_without_subsampling(self,
@@ -484,6 +838,20 @@ class AdditiveNoisePrivacyLoss(metaclass=abc.ABCMeta):
     """
     raise NotImplementedError
 
+  def _noise_cdf_and_log_cdf(
+      self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Computes both noise_cdf(x) and noise_log_cdf(x).
+
+    Subclasses may override this to share computation between the two.
+
+    Args:
+      x: the points at which the functions are to be calculated.
+
+    Returns:
+      A pair of noise_cdf(x) and noise_log_cdf(x).
+    """
+    return self.noise_cdf(x), self.noise_log_cdf(x)
+
   @classmethod
   @abc.abstractmethod
   def from_privacy_guarantee(
@@ -523,6 +891,40 @@ class AdditiveNoisePrivacyLoss(metaclass=abc.ABCMeta):
     raise NotImplementedError
 
 
+def _laplace_cdf(scaled_x: np.ndarray) -> np.ndarray:
+  """Computes the CDF of the Laplace distribution with parameter 1.
+
+  The CDF is 0.5 * exp(x) for x < 0 and 1 - 0.5 * exp(-x) otherwise. It is
+  evaluated with numpy ufuncs only, and hence broadcasts over arrays of any
+  shape without the overhead of scipy's generic distribution machinery.
+
+  Args:
+    scaled_x: the points, divided by the Laplace parameter, at which the CDF is
+      to be calculated.
+
+  Returns:
+    The CDF of the Laplace distribution with parameter 1 at scaled_x.
+  """
+  half_tail = 0.5 * np.exp(-np.abs(scaled_x))
+  return np.where(scaled_x < 0, half_tail, 1 - half_tail)
+
+
+def _laplace_log_cdf(scaled_x: np.ndarray) -> np.ndarray:
+  """Computes the log CDF of the Laplace distribution with parameter 1.
+
+  The log CDF is x - log(2) for x < 0 and log(1 - 0.5 * exp(-x)) otherwise.
+
+  Args:
+    scaled_x: the points, divided by the Laplace parameter, at which the log
+      CDF is to be calculated.
+
+  Returns:
+    The log CDF of the Laplace distribution with parameter 1 at scaled_x.
+  """
+  return np.where(scaled_x < 0, scaled_x - math.log(2),
+                  np.log1p(-0.5 * np.exp(-np.abs(scaled_x))))
+
+
 class LaplacePrivacyLoss(AdditiveNoisePrivacyLoss):
   """Privacy loss of the Laplace mechanism.
 
@@ -582,8 +984,20 @@ class LaplacePrivacyLoss(AdditiveNoisePrivacyLoss):
       raise ValueError(f'Parameter is not a positive real number: {parameter}')
 
     self._parameter = parameter
-    self._laplace_random_variable = stats.laplace(scale=parameter)
+    # Scaling by the inverse parameter avoids a division per point when
+    # evaluating the noise CDFs.
+    self._inverse_parameter = 1 / parameter
+    self._sensitivity_over_parameter = sensitivity / parameter
     super().__init__(sensitivity, False, sampling_prob, adjacency_type)
+    self._signed_sensitivity = sensitivity if self._is_add else -sensitivity
+
+  def _privacy_loss_without_subsampling_array(self,
+                                              xs: np.ndarray) -> np.ndarray:
+    """Vectorized version of privacy_loss_without_subsampling."""
+    if self._is_add:
+      return (np.abs(xs - self.sensitivity) - np.abs(xs)) / self._parameter
+    else:  # Case: self.adjacency_type == AdjacencyType.REMOVE
+      return (np.abs(xs) - np.abs(xs + self.sensitivity)) / self._parameter
 
   def privacy_loss_tail(self) -> TailPrivacyLossDistribution:
     """Computes the privacy loss at the tail of the Laplace distribution.
@@ -595,24 +1009,40 @@ class LaplacePrivacyLoss(AdditiveNoisePrivacyLoss):
     lower_x_truncation = -sensitivity and upper_x_truncation = 0
 
     The probability masses below lower_x_truncation and above upper_x_truncation
-    are computed using mu_upper_cdf.
+    are the values of mu_upper_cdf at these points, which together with the
+    privacy losses there are computed in closed form. With
+    t = e^{-sensitivity / parameter} and sub-sampling probability q,
+    For ADD adjacency type:
+      privacy losses are -log(1 - q + q * t) and -log(1 - q + q / t), with
+      probability masses 0.5 and 0.5 * t respectively.
+    For REMOVE adjacency type:
+      privacy losses are log(1 - q + q / t) and log(1 - q + q * t), with
+      probability masses 0.5 * (q + (1 - q) * t) and 0.5 * (q * t + 1 - q)
+      respectively.
 
     Returns:
       A TailPrivacyLossDistribution instance representing the tail of the
       privacy loss distribution.
     """
-    if self.adjacency_type == AdjacencyType.ADD:
-      lower_x_truncation, upper_x_truncation = 0.0, self.sensitivity
+    if self._privacy_loss_tail is not None:
+      return self._privacy_loss_tail
+    t = math.exp(-self._sensitivity_over_parameter)
+    q = self.sampling_prob
+    log_mixture_at_t, log_mixture_at_inverse_t = self._log_mixtures()
+    if self._is_add:
+      self._privacy_loss_tail = TailPrivacyLossDistribution(
+          0.0, self.sensitivity,
+          privacy_losses=np.array(
+              [-log_mixture_at_t, -log_mixture_at_inverse_t]),
+          probability_masses=np.array([0.5, 0.5 * t]))
     else:  # Case: self.adjacency_type == AdjacencyType.REMOVE
-      lower_x_truncation, upper_x_truncation = -self.sensitivity, 0.0
-
-    return TailPrivacyLossDistribution(
-        lower_x_truncation, upper_x_truncation, {
-            self.privacy_loss(lower_x_truncation):
-                self.mu_upper_cdf(lower_x_truncation),
-            self.privacy_loss(upper_x_truncation):
-                1 - self.mu_upper_cdf(upper_x_truncation)
-        })
+      self._privacy_loss_tail = TailPrivacyLossDistribution(
+          -self.sensitivity, 0.0,
+          privacy_losses=np.array(
+              [log_mixture_at_inverse_t, log_mixture_at_t]),
+          probability_masses=np.array(
+              [0.5 * (q + (1 - q) * t), 0.5 * (q * t + 1 - q)]))
+    return self._privacy_loss_tail
 
   def connect_dots_bounds(self) -> ConnectDotsBounds:
     """Computes the bounds on epsilon values to use in connect-the-dots algorithm.
@@ -630,23 +1060,41 @@ class LaplacePrivacyLoss(AdditiveNoisePrivacyLoss):
       A ConnectDotsBounds instance containing upper and lower values of
       epsilon to use in connect-the-dots algorithm.
     """
-    max_epsilon = self.sensitivity / self._parameter
+    if self._connect_dots_bounds is not None:
+      return self._connect_dots_bounds
+    max_epsilon = self._sensitivity_over_parameter
     if self.sampling_prob == 1.0:
       # For efficiency this case is handled separately.
-      return ConnectDotsBounds(epsilon_upper=max_epsilon,
-                               epsilon_lower=-max_epsilon)
-    elif self.adjacency_type == AdjacencyType.ADD:
-      return ConnectDotsBounds(
-          epsilon_upper=- math.log(1 - self.sampling_prob +
-                                   self.sampling_prob * math.exp(-max_epsilon)),
-          epsilon_lower=- math.log(1 - self.sampling_prob +
-                                   self.sampling_prob * math.exp(max_epsilon)))
+      self._connect_dots_bounds = ConnectDotsBounds(
+          epsilon_upper=max_epsilon, epsilon_lower=-max_epsilon)
+      return self._connect_dots_bounds
+    log_mixture_at_t, log_mixture_at_inverse_t = self._log_mixtures()
+    if self._is_add:
+      self._connect_dots_bounds = ConnectDotsBounds(
+          epsilon_upper=-log_mixture_at_t,
+          epsilon_lower=-log_mixture_at_inverse_t)
     else:  # Case: self.adjacency_type == AdjacencyType.REMOVE
-      return ConnectDotsBounds(
-          epsilon_upper=math.log(1 - self.sampling_prob +
-                                 self.sampling_prob * math.exp(max_epsilon)),
-          epsilon_lower=math.log(1 - self.sampling_prob +
-                                 self.sampling_prob * math.exp(-max_epsilon)))
+      self._connect_dots_bounds = ConnectDotsBounds(
+          epsilon_upper=log_mixture_at_inverse_t,
+          epsilon_lower=log_mixture_at_t)
+    return self._connect_dots_bounds
+
+  def _log_mixtures(self) -> Tuple[float, float]:
+    """Computes log(1 - q + q * t) and log(1 - q + q / t).
+
+    Here t = e^{-sensitivity / parameter} and q is the sub-sampling
+    probability. Both are computed as log1p(q * (t^{+-1} - 1)) from a single
+    call to expm1, which is accurate also when sensitivity / parameter is small.
+
+    Returns:
+      A pair of log(1 - q + q * t) and log(1 - q + q / t).
+    """
+    # e^{sensitivity / parameter} - 1, from which
+    # t - 1 = -expm1_max_epsilon / (1 + expm1_max_epsilon).
+    expm1_max_epsilon = math.expm1(self._sensitivity_over_parameter)
+    return (math.log1p(-self.sampling_prob * expm1_max_epsilon /
+                       (1 + expm1_max_epsilon)),
+            math.log1p(self.sampling_prob * expm1_max_epsilon))
 
   def privacy_loss_without_subsampling(self, x: float) -> float:
     """Computes the privacy loss of the Laplace mechanism without sub-sampling at a given point.
@@ -660,7 +1108,7 @@ class LaplacePrivacyLoss(AdditiveNoisePrivacyLoss):
       For ADD adjacency type:    (|x - sensitivity| - |x|) / parameter.
       For REMOVE adjacency type: (|x| - |x + sensitivity|) / parameter.
     """
-    if self.adjacency_type == AdjacencyType.ADD:
+    if self._is_add:
       return (abs(x - self.sensitivity) - abs(x)) / self._parameter
     else:  # Case: self.adjacency_type == AdjacencyType.REMOVE
       return (abs(x) - abs(x + self.sensitivity)) / self._parameter
@@ -690,10 +1138,16 @@ class LaplacePrivacyLoss(AdditiveNoisePrivacyLoss):
       return -math.inf
     if loss_threshold <= -self.sensitivity:
       return math.inf
-    if self.adjacency_type == AdjacencyType.ADD:
-      return 0.5 * (self.sensitivity - loss_threshold)
-    else:  # Case: self.adjacency_type == AdjacencyType.REMOVE
-      return 0.5 * (-self.sensitivity - loss_threshold)
+    return 0.5 * (self._signed_sensitivity - loss_threshold)
+
+  def _inverse_privacy_loss_without_subsampling_array(
+      self, privacy_losses: np.ndarray) -> np.ndarray:
+    """Vectorized version of inverse_privacy_loss_without_subsampling."""
+    loss_thresholds = privacy_losses * self._parameter
+    xs = 0.5 * (self._signed_sensitivity - loss_thresholds)
+    return np.where(loss_thresholds > self.sensitivity, -math.inf,
+                    np.where(loss_thresholds <= -self.sensitivity, math.inf,
+                             xs))
 
   def noise_cdf(self, x: Union[float,
                                Iterable[float]]) -> Union[float, np.ndarray]:
@@ -707,7 +1161,7 @@ class LaplacePrivacyLoss(AdditiveNoisePrivacyLoss):
       The cumulative density function of the Laplace noise at x, i.e., the
       probability that the Laplace noise is less than or equal to x.
     """
-    return self._laplace_random_variable.cdf(x)
+    return _laplace_cdf(np.multiply(x, self._inverse_parameter))[()]
 
   def noise_log_cdf(
       self, x: Union[float, Iterable[float]]) -> Union[float, np.ndarray]:
@@ -721,7 +1175,84 @@ class LaplacePrivacyLoss(AdditiveNoisePrivacyLoss):
       The log cumulative density function of the Laplace noise at x, i.e., the
       log of the probability that the Laplace noise is less than or equal to x.
     """
-    return self._laplace_random_variable.logcdf(x)
+    return _laplace_log_cdf(np.multiply(x, self._inverse_parameter))[()]
+
+  def _noise_cdf_and_log_cdf(
+      self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Computes both noise_cdf(x) and noise_log_cdf(x).
+
+    Both are derived from a single evaluation of 0.5 * exp(-|x| / parameter).
+
+    Args:
+      x: the points at which the functions are to be calculated.
+
+    Returns:
+      A pair of noise_cdf(x) and noise_log_cdf(x).
+    """
+    scaled_x = np.multiply(x, self._inverse_parameter)
+    is_negative = scaled_x < 0
+    half_tail = 0.5 * np.exp(-np.abs(scaled_x))
+    return (np.where(is_negative, half_tail, 1 - half_tail)[()],
+            np.where(is_negative, scaled_x - math.log(2),
+                     np.log1p(-half_tail))[()])
+
+  def _mu_upper_cdf_remove(
+      self, x: Union[float, Iterable[float]]) -> Union[float, np.ndarray]:
+    """Computes mu_upper_cdf for REMOVE adjacency type.
+
+    The mixture (1-q) * noise_cdf(x) + q * noise_cdf(x + sensitivity) is
+    evaluated in closed form in a single pass, separately on each of the three
+    intervals delimited by -sensitivity and 0.
+
+    Args:
+      x: the point or points at which the cumulative density function is to be
+        calculated.
+
+    Returns:
+      The cumulative density function of the mu_upper distribution at x.
+    """
+    scaled_x = np.multiply(x, self._inverse_parameter)
+    scaled_shifted_x = scaled_x + self._sensitivity_over_parameter
+    # Weighted values of 0.5 * exp(-|y| / parameter) at y = x and
+    # y = x + sensitivity respectively.
+    tail = 0.5 * (1 - self.sampling_prob) * np.exp(-np.abs(scaled_x))
+    shifted_tail = 0.5 * self.sampling_prob * np.exp(-np.abs(scaled_shifted_x))
+    return np.where(
+        scaled_shifted_x < 0, tail + shifted_tail,
+        np.where(scaled_x < 0, tail + self.sampling_prob - shifted_tail,
+                 1 - tail - shifted_tail))[()]
+
+  def _mu_lower_log_cdf_add(
+      self, x: Union[float, Iterable[float]]) -> Union[float, np.ndarray]:
+    """Computes mu_lower_log_cdf for ADD adjacency type.
+
+    The log of the mixture (1-q) * noise_cdf(x) + q * noise_cdf(x - sensitivity)
+    is evaluated in closed form in a single pass, separately on each of the
+    three intervals delimited by 0 and sensitivity. For x < 0 it is equal to
+    x / parameter - log(2) + log(1 - q + q * exp(-sensitivity / parameter)).
+
+    Args:
+      x: the point or points at which the log of the cumulative density function
+        is to be calculated.
+
+    Returns:
+      The log of the cumulative density function of the mu_lower distribution at
+      x.
+    """
+    scaled_x = np.multiply(x, self._inverse_parameter)
+    scaled_shifted_x = scaled_x - self._sensitivity_over_parameter
+    # Weighted values of 0.5 * exp(-|y| / parameter) at y = x and
+    # y = x - sensitivity respectively.
+    tail = 0.5 * (1 - self.sampling_prob) * np.exp(-np.abs(scaled_x))
+    shifted_tail = 0.5 * self.sampling_prob * np.exp(-np.abs(scaled_shifted_x))
+    log_offset = math.log1p(self.sampling_prob *
+                            math.expm1(-self._sensitivity_over_parameter))
+    return np.where(
+        scaled_x < 0, scaled_x - math.log(2) + log_offset,
+        np.where(scaled_shifted_x < 0,
+                 self._log_one_minus_sampling_prob +
+                 np.log1p((shifted_tail - tail) / (1 - self.sampling_prob)),
+                 np.log1p(-tail - shifted_tail)))[()]
 
   @classmethod
   def from_privacy_guarantee(
@@ -758,9 +1289,16 @@ class LaplacePrivacyLoss(AdditiveNoisePrivacyLoss):
       The privacy loss of the Laplace mechanism with the given privacy
         guarantee.
     """
-    parameter = (
-        sensitivity /
-        np.log(1 + (np.exp(privacy_parameters.epsilon) - 1) / sampling_prob))
+    if sampling_prob <= 0 or sampling_prob > 1:
+      raise ValueError(
+          f'Sampling probability is not in (0,1] : {sampling_prob}')
+    # expm1 and log1p keep log(1 + (exp(epsilon) - 1) / sampling_prob) accurate
+    # when epsilon is small.
+    epsilon_without_subsampling = math.log1p(
+        math.expm1(privacy_parameters.epsilon) / sampling_prob)
+    # When epsilon is 0, no finite parameter suffices.
+    parameter = (sensitivity / epsilon_without_subsampling
+                 if epsilon_without_subsampling > 0 else math.inf)
     return LaplacePrivacyLoss(
         parameter,
         sensitivity=sensitivity,
@@ -773,6 +1311,43 @@ class LaplacePrivacyLoss(AdditiveNoisePrivacyLoss):
     return self._parameter
 
 
+def _gaussian_delta_for_epsilon(standard_deviation: float, epsilon: float,
+                                sensitivity: float,
+                                sampling_prob: float) -> float:
+  """Computes the hockey-stick divergence of the Gaussian mechanism.
+
+  This is equivalent to calling get_delta_for_epsilon(epsilon) on a
+  GaussianPrivacyLoss with the given parameters and REMOVE adjacency type, but
+  evaluates the closed form directly without constructing the object.
+
+  Args:
+    standard_deviation: the standard deviation of the Gaussian noise.
+    epsilon: the epsilon in epsilon-hockey stick divergence. Must be
+      non-negative.
+    sensitivity: the sensitivity of function f.
+    sampling_prob: sub-sampling probability, a value in (0,1].
+
+  Returns:
+    The epsilon-hockey stick divergence of the mechanism.
+  """
+  # The privacy loss epsilon with sub-sampling is attained where the privacy
+  # loss without sub-sampling is log(1 + (exp(epsilon) - 1) / sampling_prob).
+  # This is always defined for non-negative epsilon.
+  privacy_loss_without_subsampling = math.log1p(
+      math.expm1(epsilon) / sampling_prob)
+  x_cutoff = (-0.5 * sensitivity - privacy_loss_without_subsampling *
+              standard_deviation**2 / sensitivity)
+  scaled_x_cutoff = x_cutoff / standard_deviation
+  mu_upper_cdf = (
+      (1 - sampling_prob) * special.ndtr(scaled_x_cutoff) +
+      sampling_prob * special.ndtr(scaled_x_cutoff +
+                                   sensitivity / standard_deviation))
+  delta = float(mu_upper_cdf) - math.exp(
+      epsilon + float(special.log_ndtr(scaled_x_cutoff)))
+  # Clip delta value to lie in [0,1] (to avoid numerical errors)
+  return min(max(delta, 0.0), 1.0)
+
+
 class GaussianPrivacyLoss(AdditiveNoisePrivacyLoss):
   """Privacy loss of the Gaussian mechanism.
 
@@ -844,10 +1419,24 @@ class GaussianPrivacyLoss(AdditiveNoisePrivacyLoss):
                        f'number: {log_mass_truncation_bound}')
 
     self._standard_deviation = standard_deviation
-    self._gaussian_random_variable = stats.norm(scale=standard_deviation)
+    self._inverse_standard_deviation = 1 / standard_deviation
     self._pessimistic_estimate = pessimistic_estimate
     self._log_mass_truncation_bound = log_mass_truncation_bound
+    # The point at which the CDF of the noise is
+    # 0.5 * exp(log_mass_truncation_bound), from which the truncation points of
+    # privacy_loss_tail are derived. special.ndtri is the inverse of the
+    # standard normal CDF.
+    self._base_lower_x_truncation = standard_deviation * float(
+        special.ndtri(0.5 * math.exp(log_mass_truncation_bound)))
     super().__init__(sensitivity, False, sampling_prob, adjacency_type)
+    self._variance = standard_deviation**2
+    # The privacy loss without sub-sampling is affine in x. Its constants are
+    # fixed by the adjacency type, so they are folded in here once instead of
+    # branching on every call.
+    self._signed_half_sensitivity = (
+        0.5 * sensitivity if self._is_add else -0.5 * sensitivity)
+    self._sensitivity_over_variance = sensitivity / self._variance
+    self._variance_over_sensitivity = self._variance / sensitivity
 
   def privacy_loss_tail(self) -> TailPrivacyLossDistribution:
     """Computes the privacy loss at the tail of the Gaussian distribution.
@@ -893,27 +1482,29 @@ class GaussianPrivacyLoss(AdditiveNoisePrivacyLoss):
       A TailPrivacyLossDistribution instance representing the tail of the
       privacy loss distribution.
     """
-    lower_x_truncation = self._gaussian_random_variable.ppf(
-        0.5 * math.exp(self._log_mass_truncation_bound))
+    if self._privacy_loss_tail is not None:
+      return self._privacy_loss_tail
+    lower_x_truncation = self._base_lower_x_truncation
     upper_x_truncation = -lower_x_truncation
-    if self.adjacency_type == AdjacencyType.ADD:
+    if self._is_add:
       upper_x_truncation += self.sensitivity
     else:  # Case: self.adjacency_type == AdjacencyType.REMOVE
       lower_x_truncation -= self.sensitivity
     if self._pessimistic_estimate:
-      tail_probability_mass_function = {
-          math.inf:
-              self.mu_upper_cdf(lower_x_truncation),
-          self.privacy_loss(upper_x_truncation):
-              1 - self.mu_upper_cdf(upper_x_truncation)
-      }
+      privacy_losses = np.array(
+          [math.inf, self.privacy_loss(upper_x_truncation)])
+      probability_masses = np.array([
+          self.mu_upper_cdf(lower_x_truncation),
+          1 - self.mu_upper_cdf(upper_x_truncation)
+      ])
     else:
-      tail_probability_mass_function = {
-          self.privacy_loss(lower_x_truncation):
-              self.mu_upper_cdf(lower_x_truncation),
-      }
-    return TailPrivacyLossDistribution(lower_x_truncation, upper_x_truncation,
-                                       tail_probability_mass_function)
+      privacy_losses = np.array([self.privacy_loss(lower_x_truncation)])
+      probability_masses = np.array([self.mu_upper_cdf(lower_x_truncation)])
+    self._privacy_loss_tail = TailPrivacyLossDistribution(
+        lower_x_truncation, upper_x_truncation,
+        privacy_losses=privacy_losses,
+        probability_masses=probability_masses)
+    return self._privacy_loss_tail
 
   def connect_dots_bounds(self) -> ConnectDotsBounds:
     """Computes the bounds on epsilon values to use in connect-the-dots algorithm.
@@ -928,11 +1519,14 @@ class GaussianPrivacyLoss(AdditiveNoisePrivacyLoss):
       A ConnectDotsBounds instance containing upper and lower values of
       epsilon to use in connect-the-dots algorithm.
     """
+    if self._connect_dots_bounds is not None:
+      return self._connect_dots_bounds
     tail_pld = self.privacy_loss_tail()
 
-    return ConnectDotsBounds(
+    self._connect_dots_bounds = ConnectDotsBounds(
         epsilon_upper=self.privacy_loss(tail_pld.lower_x_truncation),
         epsilon_lower=self.privacy_loss(tail_pld.upper_x_truncation))
+    return self._connect_dots_bounds
 
   def privacy_loss_without_subsampling(self, x: float) -> float:
     """Computes the privacy loss of the Gaussian mechanism without sub-sampling at a given point.
@@ -951,12 +1545,8 @@ class GaussianPrivacyLoss(AdditiveNoisePrivacyLoss):
       For REMOVE adjacency type:
         sensitivity * (- 0.5 * sensitivity - x) / standard_deviation^2.
     """
-    if self.adjacency_type == AdjacencyType.ADD:
-      return (self.sensitivity * (0.5 * self.sensitivity - x) /
-              (self._standard_deviation**2))
-    else:  # Case: self.adjacency_type == AdjacencyType.REMOVE
-      return (self.sensitivity * (-0.5 * self.sensitivity - x) /
-              (self._standard_deviation**2))
+    return ((self._signed_half_sensitivity - x) *
+            self._sensitivity_over_variance)
 
   def inverse_privacy_loss_without_subsampling(self,
                                                privacy_loss: float) -> float:
@@ -973,12 +1563,22 @@ class GaussianPrivacyLoss(AdditiveNoisePrivacyLoss):
       For REMOVE adjacency type:
         -0.5 * sensitivity - privacy_loss * standard_deviation^2 / sensitivity.
     """
-    if self.adjacency_type == AdjacencyType.ADD:
-      return (0.5 * self.sensitivity - privacy_loss *
-              (self._standard_deviation**2) / self.sensitivity)
-    else:  # Case: self.adjacency_type == AdjacencyType.REMOVE
-      return (-0.5 * self.sensitivity - privacy_loss *
-              (self._standard_deviation**2) / self.sensitivity)
+    return (self._signed_half_sensitivity -
+            privacy_loss * self._variance_over_sensitivity)
+
+  def _privacy_loss_without_subsampling_array(self,
+                                              xs: np.ndarray) -> np.ndarray:
+    """Vectorized version of privacy_loss_without_subsampling."""
+    # The privacy loss is affine in x, so the scalar implementation directly
+    # applies to arrays.
+    return self.privacy_loss_without_subsampling(xs)
+
+  def _inverse_privacy_loss_without_subsampling_array(
+      self, privacy_losses: np.ndarray) -> np.ndarray:
+    """Vectorized version of inverse_privacy_loss_without_subsampling."""
+    # The inverse privacy loss is affine in the privacy loss, so the scalar
+    # implementation directly applies to arrays.
+    return self.inverse_privacy_loss_without_subsampling(privacy_losses)
 
   def noise_cdf(self, x: Union[float,
                                Iterable[float]]) -> Union[float, np.ndarray]:
@@ -992,7 +1592,9 @@ class GaussianPrivacyLoss(AdditiveNoisePrivacyLoss):
       The cumulative density function of the Gaussian noise at x, i.e., the
       probability that the Gaussian noise is less than or equal to x.
     """
-    return self._gaussian_random_variable.cdf(x)
+    # special.ndtr is the standard normal CDF that stats.norm uses internally;
+    # calling it directly skips the generic distribution machinery.
+    return special.ndtr(np.multiply(x, self._inverse_standard_deviation))
 
   def noise_log_cdf(
       self, x: Union[float, Iterable[float]]) -> Union[float, np.ndarray]:
@@ -1006,7 +1608,22 @@ class GaussianPrivacyLoss(AdditiveNoisePrivacyLoss):
       The log cumulative density function of the Gaussian noise at x, i.e., the
       log of the probability that the Gaussian noise is less than or equal to x.
     """
-    return self._gaussian_random_variable.logcdf(x)
+    return special.log_ndtr(np.multiply(x, self._inverse_standard_deviation))
+
+  def _noise_cdf_and_log_cdf(
+      self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Computes both noise_cdf(x) and noise_log_cdf(x).
+
+    The input is scaled by the standard deviation only once.
+
+    Args:
+      x: the points at which the functions are to be calculated.
+
+    Returns:
+      A pair of noise_cdf(x) and noise_log_cdf(x).
+    """
+    scaled_x = np.multiply(x, self._inverse_standard_deviation)
+    return special.ndtr(scaled_x), special.log_ndtr(scaled_x)
 
   @classmethod
   def from_privacy_guarantee(
@@ -1019,7 +1636,7 @@ class GaussianPrivacyLoss(AdditiveNoisePrivacyLoss):
   ) -> 'GaussianPrivacyLoss':
     """Creates the privacy loss for Gaussian mechanism with desired privacy.
 
-    Uses binary search to find the smallest possible standard deviation of the
+    Uses Brent's method to find the smallest possible standard deviation of the
     Gaussian noise for which the mechanism is (epsilon, delta)-differentially
     private, with respect to the REMOVE relation.
 
@@ -1045,29 +1662,32 @@ class GaussianPrivacyLoss(AdditiveNoisePrivacyLoss):
     """
     if privacy_parameters.delta == 0:
       raise ValueError('delta=0 is not allowed for the Gaussian mechanism')
+    # The search below does not construct GaussianPrivacyLoss objects, so the
+    # parameters are validated here.
+    if sensitivity <= 0:
+      raise ValueError(
+          f'Sensitivity is not a positive real number: {sensitivity}')
+    if sampling_prob <= 0 or sampling_prob > 1:
+      raise ValueError(
+          f'Sampling probability is not in (0,1] : {sampling_prob}')
 
     # The initial standard deviation is set to
     # sqrt(2 * ln(1.5/delta)) * sensitivity / epsilon. It is known that, when
     # epsilon is no more than one, the Gaussian mechanism with this standard
     # deviation is (epsilon, delta)-DP. See e.g. Appendix A in Dwork and Roth
     # book, "The Algorithmic Foundations of Differential Privacy".
-    search_parameters = common.BinarySearchParameters(
-        0,
-        math.inf,
-        initial_guess=math.sqrt(2 * math.log(1.5 / privacy_parameters.delta)) *
+    initial_guess = (
+        math.sqrt(2 * math.log(1.5 / privacy_parameters.delta)) *
         sensitivity / privacy_parameters.epsilon)
 
     def _get_delta_for_standard_deviation(current_standard_deviation):
-      return GaussianPrivacyLoss(
-          current_standard_deviation,
-          sensitivity=sensitivity,
-          sampling_prob=sampling_prob,
-          adjacency_type=AdjacencyType.REMOVE).get_delta_for_epsilon(
-              privacy_parameters.epsilon)
+      return _gaussian_delta_for_epsilon(current_standard_deviation,
+                                         privacy_parameters.epsilon,
+                                         sensitivity, sampling_prob)
 
-    standard_deviation = common.inverse_monotone_function(
+    standard_deviation = common.inverse_decreasing_function(
         _get_delta_for_standard_deviation, privacy_parameters.delta,
-        search_parameters)
+        initial_guess)
 
     return GaussianPrivacyLoss(
         standard_deviation,
@@ -1082,6 +1702,124 @@ class GaussianPrivacyLoss(AdditiveNoisePrivacyLoss):
     return self._standard_deviation
 
 
+@dataclasses.dataclass(frozen=True)
+class GaussianPrivacyLossBatch:
+  """Parameters of several Gaussian mechanisms, stored as parallel arrays.
+
+  This allows evaluating quantities such as the hockey-stick divergence of many
+  Gaussian mechanisms with a single vectorized computation, instead of one
+  GaussianPrivacyLoss method call per mechanism.
+
+  Attributes:
+    standard_deviations: the standard deviation of the Gaussian noise of each
+      mechanism.
+    sensitivities: the sensitivity of each mechanism.
+    sampling_probs: the sub-sampling probability of each mechanism, a value in
+      (0,1].
+    is_add: whether each mechanism uses ADD adjacency type (as opposed to
+      REMOVE adjacency type).
+  """
+  standard_deviations: np.ndarray
+  sensitivities: np.ndarray
+  sampling_probs: np.ndarray
+  is_add: np.ndarray
+
+  @classmethod
+  def from_instances(
+      cls, privacy_losses: Iterable[GaussianPrivacyLoss]
+  ) -> 'GaussianPrivacyLossBatch':
+    """Creates a batch from GaussianPrivacyLoss instances.
+
+    Args:
+      privacy_losses: the privacy losses of the Gaussian mechanisms.
+
+    Returns:
+      A batch whose i-th entries are the parameters of the i-th privacy loss.
+    """
+    privacy_losses = list(privacy_losses)
+    return cls(
+        standard_deviations=np.array(
+            [pl.standard_deviation for pl in privacy_losses], dtype=float),
+        sensitivities=np.array([pl.sensitivity for pl in privacy_losses],
+                               dtype=float),
+        sampling_probs=np.array([pl.sampling_prob for pl in privacy_losses],
+                                dtype=float),
+        is_add=np.array(
+            [pl.adjacency_type == AdjacencyType.ADD for pl in privacy_losses],
+            dtype=bool))
+
+  def __len__(self) -> int:
+    return len(self.standard_deviations)
+
+  def privacy_loss_without_subsampling(self, x: float) -> np.ndarray:
+    """Computes the privacy loss without sub-sampling of each mechanism at x.
+
+    Args:
+      x: the point at which the privacy loss is computed.
+
+    Returns:
+      An array whose i-th entry is the privacy loss without sub-sampling of the
+      i-th mechanism at x. See
+      GaussianPrivacyLoss.privacy_loss_without_subsampling.
+    """
+    signed_half_sensitivities = np.where(self.is_add, 0.5, -0.5) * (
+        self.sensitivities)
+    return ((signed_half_sensitivities - x) * self.sensitivities /
+            self.standard_deviations**2)
+
+  def get_delta_for_epsilon(self, epsilon: float) -> np.ndarray:
+    """Computes the epsilon-hockey stick divergence of each mechanism.
+
+    Args:
+      epsilon: the epsilon in epsilon-hockey stick divergence.
+
+    Returns:
+      An array whose i-th entry is the epsilon-hockey stick divergence of the
+      i-th mechanism. See AdditiveNoisePrivacyLoss.get_delta_for_epsilon.
+    """
+    q = self.sampling_probs
+    sensitivity_over_sd = self.sensitivities / self.standard_deviations
+    # With l = privacy_loss_without_subsampling, the privacy loss is
+    # -log(1 - q + q * exp(-l)) for ADD adjacency type and
+    # log(1 - q + q * exp(l)) for REMOVE adjacency type. Where epsilon is
+    # outside the range of the privacy loss, the divergence is 0 for ADD and
+    # 1 - exp(epsilon) for REMOVE adjacency type.
+    with np.errstate(divide='ignore', invalid='ignore'):
+      log_one_minus_q = np.log1p(-q)
+      privacy_loss_without_subsampling = np.where(
+          self.is_add,
+          -np.log1p(np.expm1(-epsilon) / q),
+          np.log1p(np.expm1(epsilon) / q))
+      in_range = np.where(self.is_add, epsilon < -log_one_minus_q,
+                          epsilon > log_one_minus_q)
+      # The inverse privacy loss at epsilon divided by the standard deviation,
+      # for REMOVE adjacency type. For ADD adjacency type, it is shifted by the
+      # sensitivity.
+      scaled_x_cutoffs = (
+          -0.5 * sensitivity_over_sd -
+          privacy_loss_without_subsampling / sensitivity_over_sd)
+      scaled_x_cutoffs = np.where(self.is_add,
+                                  scaled_x_cutoffs + sensitivity_over_sd,
+                                  scaled_x_cutoffs)
+      # mu_upper_cdf and mu_lower_log_cdf at the cutoffs.
+      mu_upper_cdfs = np.where(
+          self.is_add, special.ndtr(scaled_x_cutoffs),
+          (1 - q) * special.ndtr(scaled_x_cutoffs) +
+          q * special.ndtr(scaled_x_cutoffs + sensitivity_over_sd))
+      mu_lower_log_cdfs = np.where(
+          self.is_add,
+          np.logaddexp(
+              log_one_minus_q + special.log_ndtr(scaled_x_cutoffs),
+              np.log(q) +
+              special.log_ndtr(scaled_x_cutoffs - sensitivity_over_sd)),
+          special.log_ndtr(scaled_x_cutoffs))
+      deltas = np.where(
+          in_range, mu_upper_cdfs - np.exp(epsilon + mu_lower_log_cdfs),
+          np.where(self.is_add, 0.0, -np.expm1(epsilon)))
+    # Clip delta values to lie in [0,1] (to avoid numerical errors)
+    return np.clip(deltas, 0, 1)
+
+
 class DiscreteLaplacePrivacyLoss(AdditiveNoisePrivacyLoss):
   """Privacy loss of the discrete Laplace mechanism.
 
@@ -1148,8 +1886,15 @@ class DiscreteLaplacePrivacyLoss(AdditiveNoisePrivacyLoss):
       raise ValueError(f'Sensitivity is not an integer : {sensitivity}')
 
     self._parameter = parameter
-    self._discrete_laplace_random_variable = stats.dlaplace(parameter)
+    # log(1 + exp(parameter)), the log of the normalizer of the tails of the
+    # CDF of the discrete Laplace distribution.
+    self._log_tail_normalizer = float(np.logaddexp(0, parameter))
     super().__init__(sensitivity, True, sampling_prob, adjacency_type)
+    # The privacy loss for REMOVE adjacency type at x equals that for ADD
+    # adjacency type at x + sensitivity, so both are evaluated with a single
+    # formula after shifting x by _privacy_loss_shift.
+    self._privacy_loss_shift = 0 if self._is_add else sensitivity
+    self._signed_sensitivity = sensitivity if self._is_add else -sensitivity
 
   def privacy_loss_tail(self) -> TailPrivacyLossDistribution:
     """Computes privacy loss at the tail of the discrete Laplace distribution.
@@ -1167,17 +1912,23 @@ class DiscreteLaplacePrivacyLoss(AdditiveNoisePrivacyLoss):
       A TailPrivacyLossDistribution instance representing the tail of the
       privacy loss distribution.
     """
-    if self.adjacency_type == AdjacencyType.ADD:
+    if self._privacy_loss_tail is not None:
+      return self._privacy_loss_tail
+    if self._is_add:
       lower_x_truncation, upper_x_truncation = 1, self.sensitivity - 1
     else:  # Case: self.adjacency_type == AdjacencyType.REMOVE
       lower_x_truncation, upper_x_truncation = 1 - self.sensitivity, -1
-    return TailPrivacyLossDistribution(
-        lower_x_truncation, upper_x_truncation, {
-            self.privacy_loss(lower_x_truncation - 1):
-                self.mu_upper_cdf(lower_x_truncation - 1),
-            self.privacy_loss(upper_x_truncation + 1):
-                1 - self.mu_upper_cdf(upper_x_truncation)
-        })
+    self._privacy_loss_tail = TailPrivacyLossDistribution(
+        lower_x_truncation, upper_x_truncation,
+        privacy_losses=np.array([
+            self.privacy_loss(lower_x_truncation - 1),
+            self.privacy_loss(upper_x_truncation + 1)
+        ]),
+        probability_masses=np.array([
+            self.mu_upper_cdf(lower_x_truncation - 1),
+            1 - self.mu_upper_cdf(upper_x_truncation)
+        ]))
+    return self._privacy_loss_tail
 
   def connect_dots_bounds(self) -> ConnectDotsBounds:
     """Computes the bounds on epsilon values to use in connect-the-dots algorithm.
@@ -1193,12 +1944,16 @@ class DiscreteLaplacePrivacyLoss(AdditiveNoisePrivacyLoss):
       A ConnectDotsBounds instance containing lower and upper values of x
       to use in connect-the-dots algorithm.
     """
-    if self.adjacency_type == AdjacencyType.ADD:
+    if self._connect_dots_bounds is not None:
+      return self._connect_dots_bounds
+    if self._is_add:
       lower_x, upper_x = 0, int(self.sensitivity)
     else:  # Case: self.adjacency_type == AdjacencyType.REMOVE
       lower_x, upper_x = -int(self.sensitivity), 0
 
-    return ConnectDotsBounds(lower_x=lower_x, upper_x=upper_x)
+    self._connect_dots_bounds = ConnectDotsBounds(lower_x=lower_x,
+                                                  upper_x=upper_x)
+    return self._connect_dots_bounds
 
   def privacy_loss_without_subsampling(self, x: float) -> float:
     """Computes privacy loss of the discrete Laplace mechanism without sub-sampling at a given point.
@@ -1211,14 +1966,19 @@ class DiscreteLaplacePrivacyLoss(AdditiveNoisePrivacyLoss):
       integer value x, which is given as
       For ADD adjacency type:    parameter * (|x - sensitivity| - |x|).
       For REMOVE adjacency type: parameter * (|x| - |x + sensitivity|).
+
+    Raises:
+      ValueError: if x is not an integer. This is not checked when Python runs
+        with optimizations (-O).
     """
-    if not isinstance(x, int):
+    # The check runs on every call with a single point. Callers evaluating many
+    # points go through the vectorized path, which validates the whole array
+    # at once, so the per-point check is skipped when Python runs with -O.
+    if __debug__ and not isinstance(x, int):
       raise ValueError(f'Privacy loss at x is undefined for x = {x}')
 
-    if self.adjacency_type == AdjacencyType.ADD:
-      return (abs(x - self.sensitivity) - abs(x)) * self._parameter
-    else:  # Case: self.adjacency_type == AdjacencyType.REMOVE
-      return (abs(x) - abs(x + self.sensitivity)) * self._parameter
+    x += self._privacy_loss_shift
+    return (abs(x - self.sensitivity) - abs(x)) * self._parameter
 
   def inverse_privacy_loss_without_subsampling(self,
                                                privacy_loss: float) -> float:
@@ -1245,10 +2005,24 @@ class DiscreteLaplacePrivacyLoss(AdditiveNoisePrivacyLoss):
       return -math.inf
     if loss_threshold <= -self.sensitivity:
       return math.inf
-    if self.adjacency_type == AdjacencyType.ADD:
-      return math.floor(0.5 * (self.sensitivity - loss_threshold))
-    else:  # Case: self.adjacency_type == AdjacencyType.REMOVE
-      return math.floor(0.5 * (-self.sensitivity - loss_threshold))
+    return math.floor(0.5 * (self._signed_sensitivity - loss_threshold))
+
+  def _privacy_loss_without_subsampling_array(self,
+                                              xs: np.ndarray) -> np.ndarray:
+    """Vectorized version of privacy_loss_without_subsampling."""
+    if xs.size and not np.issubdtype(xs.dtype, np.integer):
+      raise ValueError(f'Privacy loss at x is undefined for x = {xs}')
+    xs = xs + self._privacy_loss_shift
+    return (np.abs(xs - self.sensitivity) - np.abs(xs)) * self._parameter
+
+  def _inverse_privacy_loss_without_subsampling_array(
+      self, privacy_losses: np.ndarray) -> np.ndarray:
+    """Vectorized version of inverse_privacy_loss_without_subsampling."""
+    loss_thresholds = privacy_losses / self._parameter
+    xs = np.floor(0.5 * (self._signed_sensitivity - loss_thresholds))
+    return np.where(loss_thresholds > self.sensitivity, -math.inf,
+                    np.where(loss_thresholds <= -self.sensitivity, math.inf,
+                             xs))
 
   def noise_cdf(self, x: Union[float,
                                Iterable[float]]) -> Union[float, np.ndarray]:
@@ -1263,7 +2037,9 @@ class DiscreteLaplacePrivacyLoss(AdditiveNoisePrivacyLoss):
       the probability that the discrete Laplace noise is less than or equal to
       x.
     """
-    return self._discrete_laplace_random_variable.cdf(x)
+    is_non_negative, log_tail = self._noise_log_tail(x)
+    tail = np.exp(log_tail)
+    return np.where(is_non_negative, 1 - tail, tail)[()]
 
   def noise_log_cdf(
       self, x: Union[float, Iterable[float]]) -> Union[float, np.ndarray]:
@@ -1278,7 +2054,47 @@ class DiscreteLaplacePrivacyLoss(AdditiveNoisePrivacyLoss):
       i.e., the log of the probability that the discrete Laplace noise is less
       than or equal to x.
     """
-    return self._discrete_laplace_random_variable.logcdf(x)
+    is_non_negative, log_tail = self._noise_log_tail(x)
+    return np.where(is_non_negative, np.log1p(-np.exp(log_tail)),
+                    log_tail)[()]
+
+  def _noise_cdf_and_log_cdf(
+      self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Computes both noise_cdf(x) and noise_log_cdf(x).
+
+    Both are derived from a single evaluation of the tail of the CDF.
+
+    Args:
+      x: the points at which the functions are to be calculated.
+
+    Returns:
+      A pair of noise_cdf(x) and noise_log_cdf(x).
+    """
+    is_non_negative, log_tail = self._noise_log_tail(x)
+    tail = np.exp(log_tail)
+    return (np.where(is_non_negative, 1 - tail, tail)[()],
+            np.where(is_non_negative, np.log1p(-tail), log_tail)[()])
+
+  def _noise_log_tail(
+      self, x: Union[float, Iterable[float]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Computes the log of the tail of the CDF of the discrete Laplace noise.
+
+    With parameter a and k = floor(x), the CDF of the discrete Laplace
+    distribution is exp(a * (k + 1)) / (1 + exp(a)) if k < 0, and
+    1 - exp(-a * k) / (1 + exp(a)) otherwise. Both are determined by the tail
+    exp(-a * m) / (1 + exp(a)), where m = -k - 1 if k < 0 and m = k otherwise.
+
+    Args:
+      x: the point or points at which the tail is to be calculated.
+
+    Returns:
+      A pair of a boolean array indicating whether floor(x) >= 0, and the log of
+      the tail at x.
+    """
+    k = np.floor(x)
+    is_non_negative = k >= 0
+    m = np.where(is_non_negative, k, -k - 1)
+    return is_non_negative, -self._parameter * m - self._log_tail_normalizer
 
   @classmethod
   def from_privacy_guarantee(
@@ -1319,9 +2135,10 @@ class DiscreteLaplacePrivacyLoss(AdditiveNoisePrivacyLoss):
     if sampling_prob <= 0 or math.isclose(sampling_prob, 0):
       raise ValueError(
           f'Sampling probability ({sampling_prob}) is equal or too close to 0.')
-    parameter = (
-        np.log(1 + (np.exp(privacy_parameters.epsilon) - 1) / sampling_prob) /
-        sensitivity)
+    # expm1 and log1p keep log(1 + (exp(epsilon) - 1) / sampling_prob) accurate
+    # when epsilon is small.
+    parameter = math.log1p(
+        math.expm1(privacy_parameters.epsilon) / sampling_prob) / sensitivity
 
     return DiscreteLaplacePrivacyLoss(
         parameter,
@@ -1335,6 +2152,105 @@ class DiscreteLaplacePrivacyLoss(AdditiveNoisePrivacyLoss):
     return self._parameter
 
 
+def _discrete_gaussian_tables(
+    sigma: float, truncation_bound: int, dtype: np.dtype = np.dtype(np.float64)
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+  """Computes the PMF and CDF of the truncated discrete Gaussian distribution.
+
+  The returned arrays are read-only, so that they can be shared between
+  instances with the same parameters.
+
+  Args:
+    sigma: the parameter of the discrete Gaussian distribution.
+    truncation_bound: the distribution is truncated to the support
+      [-truncation_bound, truncation_bound].
+    dtype: the floating point type of the returned arrays. The tables are
+      always computed in float64 and only cast at the end.
+
+  Returns:
+    A tuple of the log PMF, log CDF, PMF and CDF arrays. Entry i of each array
+    corresponds to the point i - truncation_bound - 1, so that entry 0 is the
+    (zero) probability mass below the support.
+  """
+  return _discrete_gaussian_grid_tables([sigma], [truncation_bound], dtype)[0]
+
+
+def _discrete_gaussian_grid_tables(
+    sigmas: Sequence[float], truncation_bounds: Sequence[int], dtype: np.dtype
+) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+  """Computes the tables of several truncated discrete Gaussian distributions.
+
+  The tables of all distributions are computed at once as rows of
+  two-dimensional arrays that are padded to the largest truncation bound.
+
+  Args:
+    sigmas: the parameters of the discrete Gaussian distributions.
+    truncation_bounds: the truncation bound of each distribution.
+    dtype: the floating point type of the returned arrays.
+
+  Returns:
+    A list with the tables of each distribution, in the format returned by
+    _discrete_gaussian_tables. The arrays are read-only. For more than one
+    distribution they are copies of the rows restricted to the support of each
+    distribution, so that they do not keep the padded tables of the other
+    distributions alive.
+  """
+  # The distributions are symmetric around 0, so the unnormalized log PMF
+  # -0.5 * i^2 / sigma^2 is only computed and exponentiated at
+  # i = 1, ..., max_truncation_bound, and mirrored. The point 0 is at column
+  # center, the mass outside of the support of each row is set to zero, and
+  # the tables are filled in place.
+  max_truncation_bound = max(truncation_bounds)
+  center = max_truncation_bound + 1
+  shape = (len(sigmas), 2 * center)
+  log_pmf_array = np.empty(shape)
+  half_log_pmf = log_pmf_array[:, center + 1:]
+  half_log_pmf[:] = np.arange(1, max_truncation_bound + 1)
+  np.square(half_log_pmf, out=half_log_pmf)
+  half_log_pmf *= (-0.5 / np.square(np.asarray(sigmas, dtype=float)))[:, None]
+  half_log_pmf[np.arange(1, max_truncation_bound + 1) >
+               np.asarray(truncation_bounds)[:, None]] = -np.inf
+  log_pmf_array[:, 1:center] = half_log_pmf[:, ::-1]
+  log_pmf_array[:, 0] = -np.inf
+  log_pmf_array[:, center] = 0.0
+  pmf_array = np.empty(shape)
+  half_pmf = pmf_array[:, center + 1:]
+  np.exp(half_log_pmf, out=half_pmf)
+  pmf_array[:, 1:center] = half_pmf[:, ::-1]
+  pmf_array[:, 0] = 0.0
+  pmf_array[:, center] = 1.0
+  # The unnormalized PMF is at most 1, so the CDF can be accumulated in linear
+  # space with a single cumsum.
+  cdf_array = np.cumsum(pmf_array, axis=1)
+  normalizers = cdf_array[:, -1:].copy()
+  pmf_array /= normalizers
+  cdf_array /= normalizers
+  log_pmf_array -= np.log(normalizers)
+  with np.errstate(divide='ignore'):
+    log_cdf_array = np.log(cdf_array)
+  # For a truncation bound that is large compared to sigma, the PMF and hence
+  # the CDF underflow in linear space in the left tail, while the log PMF is
+  # still finite. There, the log CDF is accumulated in log space instead.
+  num_tiny_cdfs = np.sum(cdf_array < np.finfo(float).tiny, axis=1)
+  for row, num_tiny in enumerate(num_tiny_cdfs):
+    log_cdf_array[row, :num_tiny] = np.logaddexp.accumulate(
+        log_pmf_array[row, :num_tiny])
+  arrays = tuple(
+      array.astype(dtype, copy=False)
+      for array in (log_pmf_array, log_cdf_array, pmf_array, cdf_array))
+  tables = []
+  for row, truncation_bound in enumerate(truncation_bounds):
+    columns = slice(center - truncation_bound - 1,
+                    center + truncation_bound + 1)
+    row_tables = tuple(array[row, columns] for array in arrays)
+    if len(truncation_bounds) > 1:
+      row_tables = tuple(table.copy() for table in row_tables)
+    for table in row_tables:
+      table.setflags(write=False)
+    tables.append(row_tables)
+  return tables
+
+
 class DiscreteGaussianPrivacyLoss(AdditiveNoisePrivacyLoss):
   """Privacy loss of the discrete Gaussian mechanism.
 
@@ -1392,7 +2308,8 @@ class DiscreteGaussianPrivacyLoss(AdditiveNoisePrivacyLoss):
                sensitivity: int = 1,
                truncation_bound: Optional[int] = None,
                sampling_prob: float = 1.0,
-               adjacency_type: AdjacencyType = AdjacencyType.REMOVE) -> None:
+               adjacency_type: AdjacencyType = AdjacencyType.REMOVE,
+               dtype: Union[type, np.dtype] = np.float64) -> None:
     """Initializes the privacy loss of the discrete Gaussian mechanism.
 
     Args:
@@ -1408,35 +2325,105 @@ class DiscreteGaussianPrivacyLoss(AdditiveNoisePrivacyLoss):
       sampling_prob: sub-sampling probability, a value in (0,1].
       adjacency_type: type of adjacency relation to used for defining the
         privacy loss distribution.
+      dtype: the floating point type in which the PMF and CDF of the noise are
+        stored. The tables have about 23 * sigma entries, so for very large
+        sigma, np.float32 halves the memory they take up for the lifetime of
+        the instance. The tables are still computed in float64 and only cast
+        at the end, so this does not lower the peak memory usage during
+        construction. Moreover, np.float32 only retains about 7 significant
+        digits, and probabilities below about 1e-38 are rounded to zero, which
+        may make the computed privacy guarantees inaccurate.
+    """
+    truncation_bound = self._validated_truncation_bound(sigma, sensitivity,
+                                                        truncation_bound)
+    self._initialize(
+        sigma, sensitivity, truncation_bound, sampling_prob, adjacency_type,
+        _discrete_gaussian_tables(sigma, truncation_bound,
+                                  self._validated_dtype(dtype)))
+
+  @staticmethod
+  def _validated_truncation_bound(sigma: float, sensitivity: int,
+                                  truncation_bound: Optional[int]) -> int:
+    """Validates the parameters and returns the truncation bound to be used.
+
+    Args:
+      sigma: the parameter of the discrete Gaussian distribution.
+      sensitivity: the sensitivity of function f.
+      truncation_bound: bound for truncating the noise, or None for the default
+        bound depending on sigma.
+
+    Returns:
+      The truncation bound of the noise.
+
+    Raises:
+      ValueError: If the parameters are invalid.
     """
     if sigma <= 0:
       raise ValueError(f'Sigma is not a positive real number: {sigma}')
     if not isinstance(sensitivity, int):
       raise ValueError(f'Sensitivity is not an integer : {sensitivity}')
 
-    self._sigma = sigma
     if truncation_bound is None:
       # Tail bound from Canonne et al. ensures that the mass that gets truncated
       # is at most 1e-30. (See Proposition 1 in the supplementary material.)
-      self._truncation_bound = math.ceil(11.6 * sigma)
-    else:
-      self._truncation_bound = truncation_bound
+      truncation_bound = math.ceil(11.6 * sigma)
 
-    if 2 * self._truncation_bound < sensitivity:
+    if 2 * truncation_bound < sensitivity:
       raise ValueError(f'Truncation bound ({truncation_bound}) is smaller '
                        f'than 0.5 * sensitivity (0.5 * {sensitivity})')
+    return truncation_bound
 
-    # Create the PMF and CDF.
+  @staticmethod
+  def _validated_dtype(dtype: Union[type, np.dtype]) -> np.dtype:
+    """Validates the type in which the tables of the noise are stored.
+
+    Args:
+      dtype: the type in which the PMF and CDF of the noise are stored.
+
+    Returns:
+      The type as a NumPy dtype.
+
+    Raises:
+      ValueError: If the type is not a floating point type.
+    """
+    dtype = np.dtype(dtype)
+    if not np.issubdtype(dtype, np.floating):
+      raise ValueError(f'dtype is not a floating point type: {dtype}')
+    return dtype
+
+  def _initialize(
+      self, sigma: float, sensitivity: int, truncation_bound: int,
+      sampling_prob: float, adjacency_type: AdjacencyType,
+      tables: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]) -> None:
+    """Initializes the privacy loss from validated parameters and noise tables.
+
+    Args:
+      sigma: the parameter of the discrete Gaussian distribution.
+      sensitivity: the sensitivity of function f.
+      truncation_bound: bound for truncating the noise.
+      sampling_prob: sub-sampling probability, a value in (0,1].
+      adjacency_type: type of adjacency relation to used for defining the
+        privacy loss distribution.
+      tables: the log PMF, log CDF, PMF and CDF arrays of the noise, as returned
+        by _discrete_gaussian_tables.
+    """
+    self._sigma = sigma
+    self._truncation_bound = truncation_bound
     self._offset = -1 * self._truncation_bound - 1
-    indices = np.arange(-1 * self._truncation_bound, self._truncation_bound + 1)
-    self._log_pmf_array = np.append(-np.inf, -0.5 * indices**2 / (sigma**2))
-    self._log_cdf_array = np.logaddexp.accumulate(self._log_pmf_array)
-    self._log_pmf_array -= self._log_cdf_array[-1]
-    self._log_cdf_array -= self._log_cdf_array[-1]
-    self._pmf_array = np.exp(self._log_pmf_array)
-    self._cdf_array = np.exp(self._log_cdf_array)
+    (self._log_pmf_array, self._log_cdf_array, self._pmf_array,
+     self._cdf_array) = tables
+    self._standard_deviation = None
 
     super().__init__(sensitivity, True, sampling_prob, adjacency_type)
+    # The privacy loss for REMOVE adjacency type at x equals that for ADD
+    # adjacency type at x + sensitivity.
+    self._privacy_loss_shift = 0 if self._is_add else sensitivity
+    # Constants of the privacy loss and its inverse for ADD adjacency type. The
+    # inverse is clipped to [_inverse_lower_x, _truncation_bound].
+    self._half_sensitivity = 0.5 * sensitivity
+    self._sensitivity_over_variance = sensitivity / sigma**2
+    self._variance_over_sensitivity = sigma**2 / sensitivity
+    self._inverse_lower_x = sensitivity - self._truncation_bound - 1
 
   def privacy_loss_tail(self) -> TailPrivacyLossDistribution:
     """Computes the privacy loss at the tail of the discrete Gaussian distribution.
@@ -1461,7 +2448,9 @@ class DiscreteGaussianPrivacyLoss(AdditiveNoisePrivacyLoss):
       A TailPrivacyLossDistribution instance representing the tail of the
       privacy loss distribution.
     """
-    if self.adjacency_type == AdjacencyType.ADD:
+    if self._privacy_loss_tail is not None:
+      return self._privacy_loss_tail
+    if self._is_add:
       upper_x_truncation = self._truncation_bound
       if self.sampling_prob == 1.0:
         lower_x_truncation = self.sensitivity - self._truncation_bound
@@ -1474,9 +2463,12 @@ class DiscreteGaussianPrivacyLoss(AdditiveNoisePrivacyLoss):
       else:
         upper_x_truncation = self._truncation_bound
 
-    return TailPrivacyLossDistribution(
+    self._privacy_loss_tail = TailPrivacyLossDistribution(
         lower_x_truncation, upper_x_truncation,
-        {math.inf: self.mu_upper_cdf(lower_x_truncation - 1)})
+        privacy_losses=np.array([math.inf]),
+        probability_masses=np.array(
+            [self.mu_upper_cdf(lower_x_truncation - 1)]))
+    return self._privacy_loss_tail
 
   def connect_dots_bounds(self) -> ConnectDotsBounds:
     """Computes the bounds on epsilon values to use in connect-the-dots algorithm.
@@ -1488,10 +2480,14 @@ class DiscreteGaussianPrivacyLoss(AdditiveNoisePrivacyLoss):
       A ConnectDotsBounds instance containing lower and upper values of x
       to use in connect-the-dots algorithm.
     """
+    if self._connect_dots_bounds is not None:
+      return self._connect_dots_bounds
     tail_pld = self.privacy_loss_tail()
 
-    return ConnectDotsBounds(lower_x=int(tail_pld.lower_x_truncation),
-                             upper_x=int(tail_pld.upper_x_truncation))
+    self._connect_dots_bounds = ConnectDotsBounds(
+        lower_x=int(tail_pld.lower_x_truncation),
+        upper_x=int(tail_pld.upper_x_truncation))
+    return self._connect_dots_bounds
 
   def privacy_loss_without_subsampling(self, x: float) -> float:
     """Computes the privacy loss of the discrete Gaussian mechanism without sub-sampling at a given point.
@@ -1518,23 +2514,17 @@ class DiscreteGaussianPrivacyLoss(AdditiveNoisePrivacyLoss):
     Raises:
       ValueError: if the privacy loss is undefined.
     """
-    def privacy_loss_without_subsampling_for_add(x: float) -> float:
-      if (not isinstance(x, int) or x < -1 * self._truncation_bound or
-          x > self._truncation_bound + self.sensitivity):
-        actual_x = (
-            x if self.adjacency_type == AdjacencyType.ADD else
-            x - self.sensitivity)
-        raise ValueError(f'Privacy loss at x is undefined for x = {actual_x}')
-      if x > self._truncation_bound:
-        return -math.inf
-      if x < self.sensitivity - self._truncation_bound:
-        return math.inf
-      return self.sensitivity * (0.5 * self.sensitivity - x) / (self._sigma**2)
-
-    if self.adjacency_type == AdjacencyType.ADD:
-      return privacy_loss_without_subsampling_for_add(x)
-    else:  # Case: self.adjacency_type == AdjacencyType.REMOVE
-      return privacy_loss_without_subsampling_for_add(x + self.sensitivity)
+    # The privacy loss is computed as for ADD adjacency type at x_for_add.
+    x_for_add = x + self._privacy_loss_shift
+    if (not isinstance(x, int) or x_for_add < -1 * self._truncation_bound or
+        x_for_add > self._truncation_bound + self.sensitivity):
+      raise ValueError(f'Privacy loss at x is undefined for x = {x}')
+    if x_for_add > self._truncation_bound:
+      return -math.inf
+    if x_for_add < self.sensitivity - self._truncation_bound:
+      return math.inf
+    return ((self._half_sensitivity - x_for_add) *
+            self._sensitivity_over_variance)
 
   def inverse_privacy_loss_without_subsampling(self,
                                                privacy_loss: float) -> float:
@@ -1552,23 +2542,45 @@ class DiscreteGaussianPrivacyLoss(AdditiveNoisePrivacyLoss):
       For REMOVE adjacency type:
         Same as that for ADD decreased by sensitivity.
     """
-
-    def inverse_privacy_loss_without_subsampling_for_add(
-        privacy_loss: float) -> float:
-      if privacy_loss == -math.inf:
-        return self._truncation_bound
-      return math.floor(
-          np.clip(
-              0.5 * self.sensitivity - privacy_loss * (self._sigma**2) /
-              self.sensitivity,
-              self.sensitivity - self._truncation_bound - 1,
-              self._truncation_bound))
-
-    if self.adjacency_type == AdjacencyType.ADD:
-      return inverse_privacy_loss_without_subsampling_for_add(privacy_loss)
-    else:  # Case: self.adjacency_type == AdjacencyType.REMOVE
-      return (inverse_privacy_loss_without_subsampling_for_add(privacy_loss) -
-              self.sensitivity)
+    # The inverse is computed as for ADD adjacency type and then shifted. It is
+    # clipped with comparisons, which is much faster than np.clip for a single
+    # value, before flooring, so that privacy losses of +-infinity are mapped
+    # to the bounds.
+    x_for_add = (self._half_sensitivity -
+                 privacy_loss * self._variance_over_sensitivity)
+    if x_for_add > self._truncation_bound:
+      x_for_add = self._truncation_bound
+    elif x_for_add < self._inverse_lower_x:
+      x_for_add = self._inverse_lower_x
+    return math.floor(x_for_add) - self._privacy_loss_shift
+
+  def _privacy_loss_without_subsampling_array(self,
+                                              xs: np.ndarray) -> np.ndarray:
+    """Vectorized version of privacy_loss_without_subsampling."""
+    xs_for_add = xs + self._privacy_loss_shift
+    if xs.size and (not np.issubdtype(xs.dtype, np.integer) or
+                    np.any(xs_for_add < -1 * self._truncation_bound) or
+                    np.any(xs_for_add > self._truncation_bound +
+                           self.sensitivity)):
+      raise ValueError(f'Privacy loss at x is undefined for some x in {xs}')
+    return np.where(
+        xs_for_add > self._truncation_bound, -math.inf,
+        np.where(
+            xs_for_add < self.sensitivity - self._truncation_bound, math.inf,
+            (self._half_sensitivity - xs_for_add) *
+            self._sensitivity_over_variance))
+
+  def _inverse_privacy_loss_without_subsampling_array(
+      self, privacy_losses: np.ndarray) -> np.ndarray:
+    """Vectorized version of inverse_privacy_loss_without_subsampling."""
+    # Clipping maps a privacy loss of -infinity to truncation_bound, as in the
+    # scalar implementation.
+    xs = np.floor(
+        np.clip(
+            self._half_sensitivity -
+            privacy_losses * self._variance_over_sensitivity,
+            self._inverse_lower_x, self._truncation_bound))
+    return xs - self._privacy_loss_shift
 
   def noise_cdf(self, x: Union[float,
                                Iterable[float]]) -> Union[float, np.ndarray]:
@@ -1583,10 +2595,7 @@ class DiscreteGaussianPrivacyLoss(AdditiveNoisePrivacyLoss):
       the probability that the discrete Gaussian noise is less than or equal to
       x.
     """
-    clipped_x = np.clip(x, -1 * self._truncation_bound - 1,
-                        self._truncation_bound)
-    indices = np.floor(clipped_x).astype('int') - self._offset
-    return self._cdf_array[indices]
+    return self._cdf_array[self._cdf_indices(x)]
 
   def noise_log_cdf(
       self, x: Union[float, Iterable[float]]) -> Union[float, np.ndarray]:
@@ -1601,10 +2610,34 @@ class DiscreteGaussianPrivacyLoss(AdditiveNoisePrivacyLoss):
       i.e., the log of the probability that the discrete Gaussian noise is less
       than or equal to x.
     """
-    clipped_x = np.clip(x, -1 * self._truncation_bound - 1,
-                        self._truncation_bound)
-    indices = np.floor(clipped_x).astype('int') - self._offset
-    return self._log_cdf_array[indices]
+    return self._log_cdf_array[self._cdf_indices(x)]
+
+  def _cdf_indices(
+      self, x: Union[float, Iterable[float]]) -> Union[int, np.ndarray]:
+    """Computes the indices of the CDF tables corresponding to given points.
+
+    Args:
+      x: the point or points at which the CDF is to be looked up.
+
+    Returns:
+      The index or indices in _cdf_array and _log_cdf_array holding the CDF at
+      x, after clipping x to [-truncation_bound - 1, truncation_bound].
+    """
+    if isinstance(x, numbers.Number):
+      # Clipped with Python builtins, which is much faster than np.clip for a
+      # single value.
+      return math.floor(
+          max(min(x, self._truncation_bound),
+              -1 * self._truncation_bound - 1)) - self._offset
+    # Clipping and flooring are done in place on a single copy of x, and only
+    # the final conversion to integers allocates another array.
+    indices = np.array(x, dtype=float)
+    np.clip(indices, -1 * self._truncation_bound - 1, self._truncation_bound,
+            out=indices)
+    np.floor(indices, out=indices)
+    indices = indices.astype(np.intp)
+    indices -= self._offset
+    return indices
 
   @classmethod
   def from_privacy_guarantee(
@@ -1616,14 +2649,22 @@ class DiscreteGaussianPrivacyLoss(AdditiveNoisePrivacyLoss):
   ) -> 'DiscreteGaussianPrivacyLoss':
     """Creates the privacy loss for discrete Gaussian mechanism with desired privacy.
 
-    Uses binary search to find the smallest possible standard deviation of the
-    discrete Gaussian noise for which the protocol is (epsilon, delta)-DP.
+    Uses Brent's method to find a standard deviation of the discrete Gaussian
+    noise at which the hockey-stick divergence of the protocol crosses delta,
+    such that the protocol is (epsilon, delta)-DP.
 
     Note: Only the REMOVE adjacency type is used in determining the parameter,
       since for all epsilon > 0, the hockey-stick divergence for PLD with
       respect to the REMOVE adjacency type is at least that for PLD with respect
       to ADD adjacency type.
 
+    Note: Unlike for the Gaussian mechanism, the hockey-stick divergence is not
+      monotone in sigma, so it can cross delta more than once. The returned
+      sigma then need not be the smallest one for which the protocol is
+      (epsilon, delta)-DP. For example, for epsilon=5, delta=1e-3,
+      sensitivity=3 and sampling_prob=0.2, the protocol is (epsilon, delta)-DP
+      at sigma=1.43 but not at sigma=1.47, and sigma=1.494 is returned.
+
     Args:
       privacy_parameters: the desired privacy guarantee of the mechanism.
       sensitivity: the sensitivity of function f. (i.e. the maximum absolute
@@ -1646,32 +2687,103 @@ class DiscreteGaussianPrivacyLoss(AdditiveNoisePrivacyLoss):
     # epsilon is no more than one, the (continuous) Gaussian mechanism with this
     # standard deviation is (epsilon, delta)-DP. See e.g. Appendix A in Dwork
     # and Roth book, "The Algorithmic Foundations of Differential Privacy".
-    search_parameters = common.BinarySearchParameters(
-        0,
-        math.inf,
-        initial_guess=math.sqrt(2 * math.log(1.5 / privacy_parameters.delta)) *
+    initial_guess = (
+        math.sqrt(2 * math.log(1.5 / privacy_parameters.delta)) *
         sensitivity / privacy_parameters.epsilon)
 
+    # The tables of the noise distribution for the most recently evaluated
+    # sigma. The search ends with an evaluation at the returned sigma, so the
+    # returned privacy loss reuses its tables. Only one set of tables is kept,
+    # since they grow linearly with sigma.
+    last_tables = {}
+
+    def _create_privacy_loss(current_sigma, current_adjacency_type):
+      truncation_bound = cls._validated_truncation_bound(
+          current_sigma, sensitivity, None)
+      if current_sigma not in last_tables:
+        last_tables.clear()
+        last_tables[current_sigma] = _discrete_gaussian_tables(
+            current_sigma, truncation_bound)
+      privacy_loss = cls.__new__(cls)
+      privacy_loss._initialize(current_sigma, sensitivity, truncation_bound,
+                               sampling_prob, current_adjacency_type,
+                               last_tables[current_sigma])
+      return privacy_loss
+
     def _get_delta_for_sigma(current_sigma):
-      return DiscreteGaussianPrivacyLoss(
-          current_sigma,
-          sensitivity=sensitivity,
-          sampling_prob=sampling_prob,
-          adjacency_type=AdjacencyType.REMOVE).get_delta_for_epsilon(
+      return _create_privacy_loss(
+          current_sigma, AdjacencyType.REMOVE).get_delta_for_epsilon(
               privacy_parameters.epsilon)
 
-    sigma = common.inverse_monotone_function(_get_delta_for_sigma,
-                                             privacy_parameters.delta,
-                                             search_parameters)
+    # Each evaluation builds the tables of the noise distribution, so Brent's
+    # method is used since it needs fewer evaluations than binary search.
+    sigma = common.inverse_decreasing_function(_get_delta_for_sigma,
+                                               privacy_parameters.delta,
+                                               initial_guess)
 
-    return DiscreteGaussianPrivacyLoss(
-        sigma,
-        sensitivity=sensitivity,
-        sampling_prob=sampling_prob,
-        adjacency_type=adjacency_type)
+    return _create_privacy_loss(sigma, adjacency_type)
+
+  @classmethod
+  def from_sigma_grid(
+      cls,
+      sigmas: Iterable[float],
+      sensitivity: int = 1,
+      sampling_prob: float = 1.0,
+      adjacency_type: AdjacencyType = AdjacencyType.REMOVE,
+      dtype: Union[type, np.dtype] = np.float64
+  ) -> List['DiscreteGaussianPrivacyLoss']:
+    """Creates privacy losses of discrete Gaussian mechanisms for many sigmas.
+
+    This is equivalent to creating DiscreteGaussianPrivacyLoss(sigma, ...) for
+    each sigma, but the tables of the noise distributions are computed with a
+    single vectorized computation over all sigmas, which avoids the per-sigma
+    overhead when sweeping over many values of sigma. The truncation bound of
+    each noise is the default one. The tables are padded to the largest
+    truncation bound during the computation, so sigmas of similar magnitude
+    should be grouped together. Afterwards, each privacy loss keeps a copy of
+    only its own tables, so it does not keep the padded tables of the other
+    sigmas alive.
+
+    Args:
+      sigmas: the parameters of the discrete Gaussian distributions.
+      sensitivity: the sensitivity of function f. (i.e. the maximum absolute
+        change in f when an input to a single user changes.)
+      sampling_prob: sub-sampling probability, a value in (0,1].
+      adjacency_type: type of adjacency relation to used for defining the
+        privacy loss distribution.
+      dtype: the floating point type in which the PMF and CDF of the noise are
+        stored. See DiscreteGaussianPrivacyLoss.__init__.
+
+    Returns:
+      A list with the privacy loss of the discrete Gaussian mechanism for each
+      sigma, in the order of sigmas.
+    """
+    dtype = cls._validated_dtype(dtype)
+    sigmas = list(sigmas)
+    if not sigmas:
+      return []
+    truncation_bounds = [
+        cls._validated_truncation_bound(sigma, sensitivity, None)
+        for sigma in sigmas
+    ]
+    privacy_losses = []
+    for sigma, truncation_bound, tables in zip(
+        sigmas, truncation_bounds,
+        _discrete_gaussian_grid_tables(sigmas, truncation_bounds, dtype)):
+      privacy_loss = cls.__new__(cls)
+      privacy_loss._initialize(sigma, sensitivity, truncation_bound,
+                               sampling_prob, adjacency_type, tables)
+      privacy_losses.append(privacy_loss)
+    return privacy_losses
 
   def standard_deviation(self) -> float:
-    """The standard deviation of the corresponding discrete Gaussian noise."""
-    return math.sqrt(
-        sum(((i + self._offset)**2) * probability_mass
-            for i, probability_mass in enumerate(self._pmf_array)))
+    """The standard deviation of the corresponding discrete Gaussian noise.
+
+    The value only depends on sigma and the truncation bound, so it is computed
+    on the first call and cached.
+    """
+    if self._standard_deviation is None:
+      values = np.arange(self._offset, self._offset + len(self._pmf_array),
+                         dtype=float)
+      self._standard_deviation = math.sqrt(np.dot(values**2, self._pmf_array))
+    return self._standard_deviation
@@ -19,6 +19,8 @@ from typing import Optional
 import unittest
 
 from absl.testing import parameterized
+import numpy as np
+from scipy import special
 from scipy import stats
 
 from dp_accounting.pld import common
@@ -43,6 +45,35 @@ def _assert_connect_bounds_equal(
   testcase.assertEqual(connect_dots_bounds.upper_x, upper_x)
 
 
+class TailPrivacyLossDistributionTest(parameterized.TestCase):
+
+  def test_tail_from_probability_mass_function(self):
+    tail_pld = privacy_loss_mechanism.TailPrivacyLossDistribution(
+        -1.0, 1.0, {math.inf: 0.1, 0.5: 0.2})
+    np.testing.assert_array_equal([math.inf, 0.5], tail_pld.privacy_losses)
+    np.testing.assert_array_equal([0.1, 0.2], tail_pld.probability_masses)
+    self.assertEqual({math.inf: 0.1, 0.5: 0.2},
+                     tail_pld.tail_probability_mass_function)
+
+  def test_tail_from_arrays(self):
+    tail_pld = privacy_loss_mechanism.TailPrivacyLossDistribution(
+        -1.0, 1.0,
+        privacy_losses=np.array([math.inf, 0.5, 0.5]),
+        probability_masses=np.array([0.1, 0.2, 0.3]))
+    test_util.assert_dictionary_almost_equal(
+        self, {math.inf: 0.1, 0.5: 0.5},
+        tail_pld.tail_probability_mass_function)
+
+  def test_tail_value_errors(self):
+    with self.assertRaises(ValueError):
+      privacy_loss_mechanism.TailPrivacyLossDistribution(-1.0, 1.0)
+    with self.assertRaises(ValueError):
+      privacy_loss_mechanism.TailPrivacyLossDistribution(
+          -1.0, 1.0, {0.5: 0.2},
+          privacy_losses=np.array([0.5]),
+          probability_masses=np.array([0.2]))
+
+
 class LaplacePrivacyLossTest(parameterized.TestCase):
 
   @parameterized.parameters(
@@ -336,6 +367,83 @@ class LaplacePrivacyLossTest(parameterized.TestCase):
                                      pl.get_delta_for_epsilon(epsilon_values)):
       self.assertAlmostEqual(expected_delta, delta)
 
+  @parameterized.parameters((1.0, ADD), (0.3, ADD), (1.0, REM), (0.3, REM))
+  def test_laplace_get_delta_for_epsilon_vectorized_matches_scalar(
+      self, sampling_prob, adjacency_type):
+    pl = privacy_loss_mechanism.LaplacePrivacyLoss(
+        2.0, sampling_prob=sampling_prob, adjacency_type=adjacency_type)
+    log_one_minus_sampling_prob = math.log1p(-0.3)
+    epsilons = [-math.inf, -1.0, log_one_minus_sampling_prob, -0.1, 0.0, 0.1,
+                -log_one_minus_sampling_prob, 0.5, 1.0, 10.0]
+    self.assertSequenceAlmostEqual(
+        [pl.get_delta_for_epsilon(epsilon) for epsilon in epsilons],
+        pl.get_delta_for_epsilon(epsilons))
+
+  @parameterized.parameters((1.0, ADD), (0.3, ADD), (1.0, REM), (0.3, REM))
+  def test_laplace_privacy_loss_vectorized_matches_scalar(
+      self, sampling_prob, adjacency_type):
+    pl = privacy_loss_mechanism.LaplacePrivacyLoss(
+        2.0, sampling_prob=sampling_prob, adjacency_type=adjacency_type)
+    xs = [-30.0, -3.0, -1.0, -0.5, 0.0, 0.5, 1.0, 3.0, 30.0]
+    self.assertSequenceAlmostEqual([pl.privacy_loss(x) for x in xs],
+                                   pl.privacy_loss(xs))
+
+  @parameterized.parameters((1.0, ADD), (0.3, ADD), (1.0, REM), (0.3, REM))
+  def test_laplace_inverse_privacy_loss_vectorized_matches_scalar(
+      self, sampling_prob, adjacency_type):
+    pl = privacy_loss_mechanism.LaplacePrivacyLoss(
+        2.0, sampling_prob=sampling_prob, adjacency_type=adjacency_type)
+    log_one_minus_sampling_prob = math.log1p(-0.3)
+    if adjacency_type == ADD:
+      privacy_losses = [-math.inf, -1.0, -0.1, 0.0, 0.1,
+                        -log_one_minus_sampling_prob]
+      invalid_privacy_losses = [0.0, 1.0]
+    else:
+      privacy_losses = [log_one_minus_sampling_prob, -0.1, 0.0, 0.1, 1.0,
+                        math.inf]
+      invalid_privacy_losses = [0.0, -1.0]
+    self.assertSequenceAlmostEqual(
+        [pl.inverse_privacy_loss(privacy_loss)
+         for privacy_loss in privacy_losses],
+        pl.inverse_privacy_loss(privacy_losses))
+    if sampling_prob != 1.0:
+      with self.assertRaises(ValueError):
+        pl.inverse_privacy_loss(invalid_privacy_losses)
+
+  @parameterized.parameters((1.0, [-50.0, -2.0, -0.5, 0.0, 0.5, 2.0, 50.0]),
+                            (3.0, [-math.inf, -10.0, 0.0, 10.0, math.inf]))
+  def test_laplace_noise_cdf(self, parameter, x):
+    pl = privacy_loss_mechanism.LaplacePrivacyLoss(parameter)
+    self.assertSequenceAlmostEqual(
+        stats.laplace.cdf(x, scale=parameter), pl.noise_cdf(x))
+    self.assertSequenceAlmostEqual(
+        stats.laplace.logcdf(x, scale=parameter), pl.noise_log_cdf(x))
+    for x_value in x:
+      self.assertAlmostEqual(
+          stats.laplace.cdf(x_value, scale=parameter), pl.noise_cdf(x_value))
+
+  @parameterized.parameters((0.3, ADD), (0.3, REM), (0.9, ADD), (0.9, REM))
+  def test_laplace_subsampled_mu_cdfs(self, sampling_prob, adjacency_type):
+    parameter, sensitivity = 1.5, 2.0
+    pl = privacy_loss_mechanism.LaplacePrivacyLoss(
+        parameter, sensitivity=sensitivity, sampling_prob=sampling_prob,
+        adjacency_type=adjacency_type)
+    x = np.array([-30.0, -2.5, -2.0, -1.0, 0.0, 1.0, 2.0, 2.5, 30.0])
+    noise_cdf = stats.laplace.cdf(x, scale=parameter)
+    if adjacency_type == ADD:
+      expected_mu_upper_cdf = noise_cdf
+      expected_mu_lower_log_cdf = np.log(
+          (1 - sampling_prob) * noise_cdf + sampling_prob *
+          stats.laplace.cdf(x - sensitivity, scale=parameter))
+    else:
+      expected_mu_upper_cdf = (
+          (1 - sampling_prob) * noise_cdf + sampling_prob *
+          stats.laplace.cdf(x + sensitivity, scale=parameter))
+      expected_mu_lower_log_cdf = np.log(noise_cdf)
+    self.assertSequenceAlmostEqual(expected_mu_upper_cdf, pl.mu_upper_cdf(x))
+    self.assertSequenceAlmostEqual(expected_mu_lower_log_cdf,
+                                   pl.mu_lower_log_cdf(x))
+
 
 class GaussianPrivacyLossTest(parameterized.TestCase):
 
@@ -733,6 +841,75 @@ class GaussianPrivacyLossTest(parameterized.TestCase):
                                      pl.get_delta_for_epsilon(epsilon_values)):
       self.assertAlmostEqual(expected_delta, delta)
 
+  @parameterized.parameters((1.0, ADD), (0.3, ADD), (1.0, REM), (0.3, REM))
+  def test_gaussian_get_delta_for_epsilon_vectorized_matches_scalar(
+      self, sampling_prob, adjacency_type):
+    pl = privacy_loss_mechanism.GaussianPrivacyLoss(
+        2.0, sampling_prob=sampling_prob, adjacency_type=adjacency_type)
+    log_one_minus_sampling_prob = math.log1p(-0.3)
+    epsilons = [-math.inf, -1.0, log_one_minus_sampling_prob, -0.1, 0.0, 0.1,
+                -log_one_minus_sampling_prob, 0.5, 1.0, 10.0]
+    self.assertSequenceAlmostEqual(
+        [pl.get_delta_for_epsilon(epsilon) for epsilon in epsilons],
+        pl.get_delta_for_epsilon(epsilons))
+
+  @parameterized.parameters((1.0, 1.0, 1.0), (2.0, 6.0, 1.0), (1.0, 3.0, 0.7),
+                            (5.0, 5.0, 0.2), (0.5, 1.0, 0.01))
+  def test_gaussian_delta_for_epsilon_matches_privacy_loss(
+      self, standard_deviation, sensitivity, sampling_prob):
+    pl = privacy_loss_mechanism.GaussianPrivacyLoss(
+        standard_deviation,
+        sensitivity=sensitivity,
+        sampling_prob=sampling_prob,
+        adjacency_type=REM)
+    for epsilon in [0.0, 0.1, 1.0, 2.0]:
+      self.assertAlmostEqual(
+          pl.get_delta_for_epsilon(epsilon),
+          privacy_loss_mechanism._gaussian_delta_for_epsilon(
+              standard_deviation, epsilon, sensitivity, sampling_prob))
+
+  def _gaussian_privacy_losses_for_batch(self):
+    return [
+        privacy_loss_mechanism.GaussianPrivacyLoss(
+            standard_deviation,
+            sensitivity=sensitivity,
+            sampling_prob=sampling_prob,
+            adjacency_type=adjacency_type)
+        for standard_deviation, sensitivity, sampling_prob, adjacency_type in [
+            (1.0, 1.0, 1.0, ADD), (2.0, 3.0, 1.0, REM), (1.0, 1.0, 0.3, ADD),
+            (0.5, 2.0, 0.3, REM), (4.0, 1.0, 0.01, REM)]
+    ]
+
+  @parameterized.parameters(-1.0, 0.0, 0.1, 1.0, 3.0)
+  def test_gaussian_batch_matches_instances(self, epsilon):
+    pls = self._gaussian_privacy_losses_for_batch()
+    batch = privacy_loss_mechanism.GaussianPrivacyLossBatch.from_instances(pls)
+    self.assertLen(batch, len(pls))
+    self.assertSequenceAlmostEqual(
+        [pl.get_delta_for_epsilon(epsilon) for pl in pls],
+        batch.get_delta_for_epsilon(epsilon))
+
+  @parameterized.parameters(-5.0, -0.5, 0.0, 0.7, 4.0)
+  def test_gaussian_batch_privacy_loss_without_subsampling(self, x):
+    pls = self._gaussian_privacy_losses_for_batch()
+    batch = privacy_loss_mechanism.GaussianPrivacyLossBatch.from_instances(pls)
+    self.assertSequenceAlmostEqual(
+        [pl.privacy_loss_without_subsampling(x) for pl in pls],
+        batch.privacy_loss_without_subsampling(x))
+
+  @parameterized.parameters((1.0, [-50.0, -2.0, -0.5, 0.0, 0.5, 2.0, 50.0]),
+                            (3.0, [-math.inf, -10.0, 0.0, 10.0, math.inf]))
+  def test_gaussian_noise_cdf(self, standard_deviation, x):
+    pl = privacy_loss_mechanism.GaussianPrivacyLoss(standard_deviation)
+    self.assertSequenceAlmostEqual(
+        stats.norm.cdf(x, scale=standard_deviation), pl.noise_cdf(x))
+    self.assertSequenceAlmostEqual(
+        stats.norm.logcdf(x, scale=standard_deviation), pl.noise_log_cdf(x))
+    for x_value in x:
+      self.assertAlmostEqual(
+          stats.norm.cdf(x_value, scale=standard_deviation),
+          pl.noise_cdf(x_value))
+
 
 class DiscreteLaplacePrivacyLossDistributionTest(parameterized.TestCase):
 
@@ -1044,6 +1221,31 @@ class DiscreteLaplacePrivacyLossDistributionTest(parameterized.TestCase):
                                      pl.get_delta_for_epsilon(epsilon_values)):
       self.assertAlmostEqual(expected_delta, delta)
 
+  @parameterized.parameters((1.0, ADD), (0.3, ADD), (1.0, REM), (0.3, REM))
+  def test_discrete_laplace_get_delta_for_epsilon_vectorized_matches_scalar(
+      self, sampling_prob, adjacency_type):
+    pl = privacy_loss_mechanism.DiscreteLaplacePrivacyLoss(
+        0.5, sampling_prob=sampling_prob, adjacency_type=adjacency_type)
+    log_one_minus_sampling_prob = math.log1p(-0.3)
+    epsilons = [-math.inf, -1.0, log_one_minus_sampling_prob, -0.1, 0.0, 0.1,
+                -log_one_minus_sampling_prob, 0.5, 1.0, 10.0]
+    self.assertSequenceAlmostEqual(
+        [pl.get_delta_for_epsilon(epsilon) for epsilon in epsilons],
+        pl.get_delta_for_epsilon(epsilons))
+
+  @parameterized.parameters(
+      (0.5, [-50, -3, -2.5, -1, -0.5, 0, 0.5, 1, 2, 50]),
+      (2.0, [-math.inf, -10, 0, 10, math.inf]))
+  def test_discrete_laplace_noise_cdf(self, parameter, x):
+    pl = privacy_loss_mechanism.DiscreteLaplacePrivacyLoss(parameter)
+    self.assertSequenceAlmostEqual(
+        stats.dlaplace.cdf(x, parameter), pl.noise_cdf(x))
+    self.assertSequenceAlmostEqual(
+        stats.dlaplace.logcdf(x, parameter), pl.noise_log_cdf(x))
+    for x_value in x:
+      self.assertAlmostEqual(
+          stats.dlaplace.cdf(x_value, parameter), pl.noise_cdf(x_value))
+
 
 class DiscreteGaussianPrivacyLossTest(parameterized.TestCase):
 
@@ -1288,12 +1490,105 @@ class DiscreteGaussianPrivacyLossTest(parameterized.TestCase):
     for x, cdf_value in x_to_cdf_value.items():
       self.assertAlmostEqual(cdf_value, pl.noise_cdf(x))
 
+  @parameterized.parameters((0.5, None), (4.0, None), (3.0, 2))
+  def test_discrete_gaussian_noise_log_cdf(self, sigma, truncation_bound):
+    pl = privacy_loss_mechanism.DiscreteGaussianPrivacyLoss(
+        sigma, truncation_bound=truncation_bound)
+    bound = pl._truncation_bound
+    xs = np.arange(-bound, bound + 1)
+    self.assertSequenceAlmostEqual(np.log(pl.noise_cdf(xs)),
+                                   pl.noise_log_cdf(xs))
+    self.assertEqual(-math.inf, pl.noise_log_cdf(-bound - 1))
+    self.assertEqual(1.0, pl.noise_cdf(bound))
+
+  @parameterized.parameters((1.0, 60), (0.5, 40))
+  def test_discrete_gaussian_noise_log_cdf_large_truncation_bound(
+      self, sigma, truncation_bound):
+    # The PMF underflows to 0 in linear space in the left tail, but the log CDF
+    # is still finite there.
+    pl = privacy_loss_mechanism.DiscreteGaussianPrivacyLoss(
+        sigma, truncation_bound=truncation_bound)
+    support = np.arange(-truncation_bound, truncation_bound + 1)
+    log_pmf = -0.5 * support**2 / sigma**2
+    expected_log_cdf = (
+        np.logaddexp.accumulate(log_pmf) - special.logsumexp(log_pmf))
+    self.assertEqual(0.0, pl.noise_cdf(-truncation_bound))
+    for x, expected_log_cdf_value in zip(support, expected_log_cdf):
+      log_cdf_value = pl.noise_log_cdf(int(x))
+      self.assertTrue(math.isfinite(log_cdf_value))
+      self.assertAlmostEqual(
+          expected_log_cdf_value, log_cdf_value,
+          delta=1e-12 * max(1.0, abs(expected_log_cdf_value)))
+
+  def test_discrete_gaussian_tail_and_bounds_cached(self):
+    pl = privacy_loss_mechanism.DiscreteGaussianPrivacyLoss(
+        2.5, sampling_prob=0.5)
+    self.assertIs(pl.privacy_loss_tail(), pl.privacy_loss_tail())
+    self.assertNotIn('privacy_loss_tail', vars(pl))
+    self.assertIs(pl.connect_dots_bounds(), pl.connect_dots_bounds())
+    self.assertNotIn('connect_dots_bounds', vars(pl))
+
+  @parameterized.parameters(ADD, REM)
+  def test_discrete_gaussian_float32_tables(self, adjacency_type):
+    pl64 = privacy_loss_mechanism.DiscreteGaussianPrivacyLoss(
+        50.0, sensitivity=3, sampling_prob=0.5, adjacency_type=adjacency_type)
+    pl32 = privacy_loss_mechanism.DiscreteGaussianPrivacyLoss(
+        50.0, sensitivity=3, sampling_prob=0.5, adjacency_type=adjacency_type,
+        dtype=np.float32)
+    self.assertEqual(np.float32, pl32._cdf_array.dtype)
+    self.assertEqual(np.float64, pl64._cdf_array.dtype)
+    x = np.arange(-100, 100, 7)
+    np.testing.assert_allclose(pl64.noise_cdf(x), pl32.noise_cdf(x), rtol=1e-6)
+    self.assertAlmostEqual(
+        pl64.get_delta_for_epsilon(0.1),
+        pl32.get_delta_for_epsilon(0.1),
+        places=6)
+
+  @parameterized.parameters(np.int64, np.bool_, np.complex128)
+  def test_discrete_gaussian_non_floating_dtype_value_errors(self, dtype):
+    with self.assertRaises(ValueError):
+      privacy_loss_mechanism.DiscreteGaussianPrivacyLoss(2.0, dtype=dtype)
+    with self.assertRaises(ValueError):
+      privacy_loss_mechanism.DiscreteGaussianPrivacyLoss.from_sigma_grid(
+          [1.0, 2.0], dtype=dtype)
+
+  @parameterized.parameters((ADD, 1, 1.0), (REM, 2, 0.3))
+  def test_discrete_gaussian_from_sigma_grid(self, adjacency_type, sensitivity,
+                                             sampling_prob):
+    sigmas = [0.5, 4.0, 1.5]
+    pls = privacy_loss_mechanism.DiscreteGaussianPrivacyLoss.from_sigma_grid(
+        sigmas, sensitivity=sensitivity, sampling_prob=sampling_prob,
+        adjacency_type=adjacency_type)
+    self.assertLen(pls, len(sigmas))
+    x = np.arange(-60, 60)
+    for sigma, pl in zip(sigmas, pls):
+      expected_pl = privacy_loss_mechanism.DiscreteGaussianPrivacyLoss(
+          sigma, sensitivity=sensitivity, sampling_prob=sampling_prob,
+          adjacency_type=adjacency_type)
+      self.assertEqual(expected_pl._truncation_bound, pl._truncation_bound)
+      np.testing.assert_allclose(expected_pl._pmf_array, pl._pmf_array)
+      np.testing.assert_allclose(
+          expected_pl.noise_cdf(x), pl.noise_cdf(x), rtol=1e-14)
+      self.assertAlmostEqual(
+          expected_pl.get_delta_for_epsilon(0.5),
+          pl.get_delta_for_epsilon(0.5))
+      self.assertFalse(pl._cdf_array.flags.writeable)
+      # The tables do not reference the padded tables of all sigmas.
+      self.assertIsNone(pl._cdf_array.base)
+
+  def test_discrete_gaussian_from_sigma_grid_value_errors(self):
+    with self.assertRaises(ValueError):
+      privacy_loss_mechanism.DiscreteGaussianPrivacyLoss.from_sigma_grid(
+          [1.0, -1.0])
+
   @parameterized.parameters((1.0, 1, 1, 0.7403629), (3.0, 2, 2, 1.3589226))
   def test_discrete_gaussian_std(self, sigma, sensitivity, truncation_bound,
                                  expected_std):
     pl = privacy_loss_mechanism.DiscreteGaussianPrivacyLoss(
         sigma, sensitivity=sensitivity, truncation_bound=truncation_bound)
     self.assertAlmostEqual(expected_std, pl.standard_deviation())
+    # The cached value is returned on subsequent calls.
+    self.assertAlmostEqual(expected_std, pl.standard_deviation())
 
   @parameterized.parameters((-1, 1.0, 1.0, 0.1), (0.5, 1.0, 1.0, 0.1),
                             (0, 0.7, 1.0, 0.2), (1, 1.0, 1.0, 0.0),
@@ -1338,6 +1633,26 @@ class DiscreteGaussianPrivacyLossTest(parameterized.TestCase):
     self.assertAlmostEqual(expected_sigma, pl._sigma, 3)
     self.assertEqual(adjacency_type, pl.adjacency_type)
 
+  def test_discrete_gaussian_from_privacy_parameters_non_monotone_delta(self):
+    epsilon, delta, sensitivity, sampling_prob = 5.0, 1e-3, 3, 0.2
+
+    def get_delta_for_sigma(sigma):
+      return privacy_loss_mechanism.DiscreteGaussianPrivacyLoss(
+          sigma, sensitivity=sensitivity,
+          sampling_prob=sampling_prob).get_delta_for_epsilon(epsilon)
+
+    # Delta crosses the target more than once as a function of sigma.
+    self.assertLessEqual(get_delta_for_sigma(1.43), delta)
+    self.assertGreater(get_delta_for_sigma(1.47), delta)
+    pl = (
+        privacy_loss_mechanism.DiscreteGaussianPrivacyLoss
+        .from_privacy_guarantee(
+            common.DifferentialPrivacyParameters(epsilon, delta),
+            sensitivity,
+            sampling_prob=sampling_prob))
+    self.assertAlmostEqual(1.494, pl._sigma, 3)
+    self.assertLessEqual(pl.get_delta_for_epsilon(epsilon), delta)
+
   @parameterized.parameters(
       # Tests with sampling_prob = 1 for adjacency_type=ADD
       (1.0, 1, 2, 1.0, ADD, 1.0, 0.150574425),
@@ -1396,6 +1711,36 @@ class DiscreteGaussianPrivacyLossTest(parameterized.TestCase):
                                      pl.get_delta_for_epsilon(epsilon_values)):
       self.assertAlmostEqual(expected_delta, delta)
 
+  @parameterized.parameters((1.0, ADD), (0.3, ADD), (1.0, REM), (0.3, REM))
+  def test_discrete_gaussian_get_delta_for_epsilon_vectorized_matches_scalar(
+      self, sampling_prob, adjacency_type):
+    pl = privacy_loss_mechanism.DiscreteGaussianPrivacyLoss(
+        2.0,
+        sensitivity=2,
+        sampling_prob=sampling_prob,
+        adjacency_type=adjacency_type)
+    log_one_minus_sampling_prob = math.log1p(-0.3)
+    epsilons = [-math.inf, -1.0, log_one_minus_sampling_prob, -0.1, 0.0, 0.1,
+                -log_one_minus_sampling_prob, 0.5, 1.0, 10.0]
+    self.assertSequenceAlmostEqual(
+        [pl.get_delta_for_epsilon(epsilon) for epsilon in epsilons],
+        pl.get_delta_for_epsilon(epsilons))
+
+  @parameterized.parameters((1.0, ADD), (0.3, ADD), (1.0, REM), (0.3, REM))
+  def test_discrete_gaussian_privacy_loss_vectorized_matches_scalar(
+      self, sampling_prob, adjacency_type):
+    pl = privacy_loss_mechanism.DiscreteGaussianPrivacyLoss(
+        2.0,
+        sensitivity=2,
+        truncation_bound=5,
+        sampling_prob=sampling_prob,
+        adjacency_type=adjacency_type)
+    xs = list(range(-5, 8)) if adjacency_type == ADD else list(range(-7, 6))
+    self.assertSequenceAlmostEqual([pl.privacy_loss(x) for x in xs],
+                                   pl.privacy_loss(xs))
+    with self.assertRaises(ValueError):
+      pl.privacy_loss([0, 100])
+
 
 if __name__ == '__main__':
   unittest.main()